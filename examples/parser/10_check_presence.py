@@ -14,6 +14,8 @@ Features shown:
 from __future__ import annotations
 
 import tempfile
+from itertools import repeat
+from operator import attrgetter, methodcaller
 from pathlib import Path
 
 # Create sample log first
@@ -54,7 +56,7 @@ def create_sample_log() -> Path:
 
 def main():
     """Demonstrate check presence functionality."""
-    from logxy_log_parser import check_log, parse_log, count_by, types
+    from logxy_log_parser import check_log, count_by, types
     from logxy_log_parser.filter import LogFilter
 
     # Create sample log
@@ -88,8 +90,8 @@ def main():
     print("2. TYPE & COUNT - Identify Entry Types")
     print("=" * 60)
 
-    # Parse log for detailed analysis
-    entries = parse_log(log_path)
+    # Reuse the entries check_log already parsed
+    entries = result.entries
 
     # Count by log level
     level_counts = count_by(entries, key="level")
@@ -100,8 +102,8 @@ def main():
     print(f"Entries by action type: {action_counts}")
 
     # Get unique entry types
-    entry_types = types(entries)
-    print(f"Unique message types: {len(set(e.message_type for e in entries))}")
+    entry_types = types(entries, "message_type")
+    print(f"Unique message types: {len(entry_types)}")
 
     # ========================================
     # 3. PYTHON-NATIVE - Standard Operations
@@ -114,8 +116,8 @@ def main():
     error_entries = [e for e in entries if e.is_error]
     print(f"Error entries (list comprehension): {len(error_entries)}")
 
-    # Use any() for presence check
-    has_api_requests = any(e.action_type == "api:request" for e in entries)
+    # Use `in` over map(attrgetter) for presence check (iteration stays in C, stops at first hit)
+    has_api_requests = "api:request" in map(attrgetter("action_type"), entries)
     print(f"Has API requests: {has_api_requests}")
 
     # Use filter() with LogFilter
@@ -142,11 +144,7 @@ def main():
     print(f"Most common error: {error_summary.most_common[0]}")
 
     # Check for specific field values
-    has_user_999 = any(
-        e.fields.get("user_id") == 999
-        for e in entries
-        if e.fields
-    )
+    has_user_999 = 999 in map(dict.get, map(attrgetter("fields"), entries), repeat("user_id"))
     print(f"Contains user_id=999: {has_user_999}")
 
     # ========================================
@@ -157,11 +155,7 @@ def main():
     print("=" * 60)
 
     # Check for entries with specific field
-    has_rows_field = any(
-        "rows" in e.fields
-        for e in entries
-        if e.fields
-    )
+    has_rows_field = any(map(methodcaller("__contains__", "rows"), map(attrgetter("fields"), entries)))
     print(f"Has 'rows' field: {has_rows_field}")
 
     # Check for duration threshold
@@ -172,9 +166,11 @@ def main():
     print(f"Slow entries (>1ms): {len(slow_entries)}")
 
     # Check for specific message content
+    needle = "reconnect"
     has_reconnect = any(
-        e.message and "reconnect" in e.message.lower()
-        for e in entries
+        needle in message.lower()
+        for message in map(attrgetter("message"), entries)
+        if message
     )
     print(f"Contains 'reconnect': {has_reconnect}")
 
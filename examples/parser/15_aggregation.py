@@ -9,9 +9,9 @@ Demonstrates aggregation capabilities:
 """
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
-from datetime import datetime
 
 # Create sample logs first
 from logxpy import log, to_file, start_action
@@ -23,16 +23,9 @@ def create_sample_logs() -> list[Path]:
 
     # Create 3 log files simulating different servers
     for server_id in [1, 2, 3]:
-        log_file = tempfile.NamedTemporaryFile(
-            mode="w",
-            delete=False,
-            suffix=f"_server{server_id}.log"
-        )
-        log_path = Path(log_file.name)
-
-        if log_path.exists():
-            log_path.unlink()
-        with open(log_path, "w", encoding="utf-8") as f:
+        fd, name = tempfile.mkstemp(suffix=f"_server{server_id}.log")
+        log_path = Path(name)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
             to_file(f)
 
         # Generate entries for each server
@@ -56,7 +49,7 @@ def create_sample_logs() -> list[Path]:
 def main():
     """Demonstrate aggregation functionality."""
     from logxy_log_parser.aggregation import LogAggregator, MultiFileAnalyzer
-    from logxy_log_parser import TimeSeriesAnalyzer, LogAnalyzer
+    from logxy_log_parser import LogAnalyzer
 
     # Create sample logs
     log_paths = create_sample_logs()
@@ -190,9 +183,9 @@ def main():
     deepest = combined_analyzer.deepest_nesting()
     print(f"Deepest nesting level: {deepest}")
 
-    widest = combined_analyzer.widest_tasks()
+    widest = combined_analyzer.widest_tasks(3)
     print(f"\nWidest tasks (top 3):")
-    for task_uuid, count in widest[:3]:
+    for task_uuid, count in widest:
         print(f"  {task_uuid}: {count} entries")
 
     # Cleanup
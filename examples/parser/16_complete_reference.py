@@ -14,21 +14,30 @@ Comprehensive demonstration of ALL logxy-log-parser features:
 """
 from __future__ import annotations
 
+import io
+import os
+import sys
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
 # Create sample log first
 from logxpy import log, to_file, start_action
 
+if TYPE_CHECKING:
+    from logxy_log_parser import LogAnalyzer, LogEntry
+
+EXPORT_DIR = Path(tempfile.gettempdir()) / "logxy_exports"
+
 
 def create_comprehensive_sample_log() -> Path:
     """Create a comprehensive sample log file with all features."""
-    log_file = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".log")
-    log_path = Path(log_file.name)
-
-    if log_path.exists():
-        log_path.unlink()
-    with open(log_path, "w", encoding="utf-8") as f:
+    fd, name = tempfile.mkstemp(suffix=".log")
+    log_path = Path(name)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
         to_file(f)
 
     # Generate diverse log entries demonstrating all features
@@ -82,73 +91,68 @@ def create_comprehensive_sample_log() -> Path:
     return log_path
 
 
-def main():
-    """Comprehensive demonstration of all features."""
-    print("=" * 70)
-    print("LOGXY LOG PARSER - COMPLETE FEATURE REFERENCE")
-    print("=" * 70)
-
-    # Create comprehensive sample log
-    log_path = create_comprehensive_sample_log()
-    print(f"\nCreated comprehensive sample log: {log_path}")
-
-    # ========================================
-    # 1. SIMPLE ONE-LINE API
-    # ========================================
-    print("\n" + "=" * 70)
-    print("1. SIMPLE ONE-LINE API")
-    print("=" * 70)
+def section_1_simple_api(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Simple one-line API: check, parse, count, types."""
+    print("\n" + "=" * 70, file=out)
+    print("1. SIMPLE ONE-LINE API", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser import check_log, parse_log, count_by, types
 
     # Quick check in one line
     result = check_log(log_path)
-    print(f"check_log(): {len(result._entries)} entries parsed")
+    print(f"check_log(): {len(result._entries)} entries parsed", file=out)
 
     # Parse entire file in one line
     entries = parse_log(log_path)
-    print(f"parse_log(): {len(entries)} entries returned")
+    print(f"parse_log(): {len(entries)} entries returned", file=out)
 
     # Count by level
     level_counts = count_by(entries, key="level")
-    print(f"count_by(level): {dict(level_counts)}")
+    print(f"count_by(level): {dict(level_counts)}", file=out)
 
     # Get entry types
-    entry_types = types(entries)
-    print(f"types(): {len(set(e.message_type for e in entries))} unique types")
+    entry_types = types(entries, "message_type")
+    print(f"types(): {len(entry_types)} unique types", file=out)
 
-    # ========================================
-    # 2. INDEXING SYSTEM
-    # ========================================
-    print("\n" + "=" * 70)
-    print("2. INDEXING SYSTEM - Fast Lookups")
-    print("=" * 70)
+
+def section_2_indexing(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Indexing system: fast lookups."""
+    print("\n" + "=" * 70, file=out)
+    print("2. INDEXING SYSTEM - Fast Lookups", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser import LogIndex, IndexedLogParser
 
     index = LogIndex.build(log_path)
-    print(f"LogIndex.build(): Index created with {len(index._entries)} entries")
+    print(f"LogIndex.build(): Index created with {len(index._entries)} entries", file=out)
 
     # Fast lookups
     errors = index.find_by_level("error")
-    print(f"find_by_level('error'): {len(errors)} entries")
+    print(f"find_by_level('error'): {len(errors)} entries", file=out)
 
     if index._entries:
         first_task = index._entries[0].task_uuid
         task_entries = index.find_by_task(first_task)
-        print(f"find_by_task(): {len(task_entries)} entries for {first_task}")
+        print(f"find_by_task(): {len(task_entries)} entries for {first_task}", file=out)
 
     # Indexed parser for queries
     parser = IndexedLogParser(log_path)
     query_result = parser.query(level="warning")
-    print(f"IndexedLogParser.query(level='warning'): {len(query_result)} entries")
+    print(f"IndexedLogParser.query(level='warning'): {len(query_result)} entries", file=out)
 
-    # ========================================
-    # 3. POWERFUL FILTERING
-    # ========================================
-    print("\n" + "=" * 70)
-    print("3. POWERFUL FILTERING - Chainable Filters")
-    print("=" * 70)
+
+def section_3_filtering(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Powerful filtering: chainable filters."""
+    print("\n" + "=" * 70, file=out)
+    print("3. POWERFUL FILTERING - Chainable Filters", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser.filter import LogFilter
 
@@ -161,27 +165,27 @@ def main():
          .sort("timestamp", reverse=False)
          .limit(10)
     )
-    print(f"Filtered (error/critical + database:*): {len(results)} entries")
+    print(f"Filtered (error/critical + database:*): {len(results)} entries", file=out)
 
     # By time range
-    from datetime import datetime, timedelta
-
     if entries:
         first_ts = min(e.timestamp for e in entries)
         last_ts = max(e.timestamp for e in entries)
         time_results = f.by_time_range(first_ts, first_ts + (last_ts - first_ts) / 2)
-        print(f"by_time_range(first half): {len(time_results)} entries")
+        print(f"by_time_range(first half): {len(time_results)} entries", file=out)
 
     # By duration
     slow = f.slow_actions(threshold=0.001)
-    print(f"slow_actions(>1ms): {len(slow)} entries")
+    print(f"slow_actions(>1ms): {len(slow)} entries", file=out)
 
-    # ========================================
-    # 4. TIME SERIES ANALYSIS
-    # ========================================
-    print("\n" + "=" * 70)
-    print("4. TIME SERIES ANALYSIS")
-    print("=" * 70)
+
+def section_4_time_series(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Time series analysis."""
+    print("\n" + "=" * 70, file=out)
+    print("4. TIME SERIES ANALYSIS", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser import TimeSeriesAnalyzer
 
@@ -189,177 +193,227 @@ def main():
 
     # Bucket by interval
     buckets = ts_analyzer.bucket_by_interval(interval_seconds=1)
-    print(f"bucket_by_interval(1s): {len(buckets)} buckets created")
+    print(f"bucket_by_interval(1s): {len(buckets)} buckets created", file=out)
 
     # Detect anomalies
     anomalies = ts_analyzer.detect_anomalies(window_size=3, threshold=1.0)
-    print(f"detect_anomalies(): {len(anomalies)} anomalies found")
+    print(f"detect_anomalies(): {len(anomalies)} anomalies found", file=out)
 
     # Error rate trend
     error_trend = ts_analyzer.error_rate_trend(interval_seconds=1)
-    print(f"error_rate_trend(): {len(error_trend)} data points")
+    print(f"error_rate_trend(): {len(error_trend)} data points", file=out)
 
     # Burst detection
     bursts = ts_analyzer.burst_detection(threshold=1.5, min_interval=0.5)
-    print(f"burst_detection(): {len(bursts)} bursts detected")
+    print(f"burst_detection(): {len(bursts)} bursts detected", file=out)
 
     # Activity heatmap
     heatmap = ts_analyzer.activity_heatmap(hour_granularity=True)
-    print(f"activity_heatmap(): {len(heatmap)} time periods analyzed")
+    print(f"activity_heatmap(): {len(heatmap)} time periods analyzed", file=out)
 
-    # ========================================
-    # 5. AGGREGATION
-    # ========================================
-    print("\n" + "=" * 70)
-    print("5. AGGREGATION - Multi-File Analysis")
-    print("=" * 70)
+
+def section_5_aggregation(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Aggregation: multi-file analysis."""
+    print("\n" + "=" * 70, file=out)
+    print("5. AGGREGATION - Multi-File Analysis", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser.aggregation import MultiFileAnalyzer
 
     # Create additional log files for aggregation demo
     temp_dir = Path(tempfile.gettempdir())
-    analyzer = MultiFileAnalyzer(temp_dir, pattern="*.log")
+    multi_analyzer = MultiFileAnalyzer(temp_dir, pattern="*.log")
 
-    log_files = list(temp_dir.glob("*.log"))[:3]  # Use first 3 log files
+    log_files = list(islice(temp_dir.glob("*.log"), 3))  # Use first 3 log files
     if len(log_files) > 1:
-        agg_analyzer = MultiFileAnalyzer(temp_dir, pattern=log_files[0].name.replace(str(temp_dir) + "/", "")[:8] + "*")
-        print(f"MultiFileAnalyzer: Found {analyzer.file_count} log files")
+        print(f"MultiFileAnalyzer: Found {multi_analyzer.file_count} log files", file=out)
 
         # Time series across files
-        ts_data = analyzer.time_series_analysis(interval_seconds=3600)
-        print(f"time_series_analysis(): {len(ts_data)} data points")
+        ts_data = multi_analyzer.time_series_analysis(interval_seconds=3600)
+        print(f"time_series_analysis(): {len(ts_data)} data points", file=out)
 
-    # ========================================
-    # 6. ANALYSIS
-    # ========================================
-    print("\n" + "=" * 70)
-    print("6. ANALYSIS - Performance & Error Analysis")
-    print("=" * 70)
 
-    from logxy_log_parser import LogAnalyzer
-
-    analyzer = LogAnalyzer(entries)
+def section_6_analysis(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Analysis: performance and error analysis."""
+    print("\n" + "=" * 70, file=out)
+    print("6. ANALYSIS - Performance & Error Analysis", file=out)
+    print("=" * 70, file=out)
 
     # Performance stats
     slowest = analyzer.slowest_actions(n=3)
-    print(f"slowest_actions(3): {[(s.action_type, s.mean_duration) for s in slowest]}")
+    print(f"slowest_actions(3): {[(s.action_type, s.mean_duration) for s in slowest]}", file=out)
 
     # Error summary
     error_summary = analyzer.error_summary()
-    print(f"\nerror_summary():")
-    print(f"  Total errors: {error_summary.total_count}")
-    print(f"  Unique types: {error_summary.unique_types}")
-    print(f"  Most common: {error_summary.most_common}")
+    print(f"\nerror_summary():", file=out)
+    print(f"  Total errors: {error_summary.total_count}", file=out)
+    print(f"  Unique types: {error_summary.unique_types}", file=out)
+    print(f"  Most common: {error_summary.most_common}", file=out)
 
     # Duration by action
     duration_by_action = analyzer.duration_by_action()
-    print(f"\nduration_by_action(): {list(duration_by_action.keys())}")
+    print(f"\nduration_by_action(): {list(duration_by_action.keys())}", file=out)
 
     # Task analysis
     deepest = analyzer.deepest_nesting()
-    print(f"\ndeepest_nesting(): {deepest} levels")
+    print(f"\ndeepest_nesting(): {deepest} levels", file=out)
 
-    # ========================================
-    # 7. EXPORT
-    # ========================================
-    print("\n" + "=" * 70)
-    print("7. EXPORT - Multiple Formats")
-    print("=" * 70)
+
+def section_7_export(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Export: multiple formats."""
+    print("\n" + "=" * 70, file=out)
+    print("7. EXPORT - Multiple Formats", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser.filter import LogEntries
 
     log_entries = LogEntries(entries)
-    output_dir = Path(tempfile.gettempdir()) / "logxy_exports"
+    output_dir = EXPORT_DIR
     output_dir.mkdir(exist_ok=True)
 
-    # JSON export
-    log_entries.to_json(output_dir / "export.json")
-    print(f"to_json(): Exported to {output_dir / 'export.json'}")
-
-    # CSV export
-    log_entries.to_csv(output_dir / "export.csv")
-    print(f"to_csv(): Exported to {output_dir / 'export.csv'}")
-
-    # HTML export
-    log_entries.to_html(output_dir / "export.html")
-    print(f"to_html(): Exported to {output_dir / 'export.html'}")
-
-    # Markdown export
-    log_entries.to_markdown(output_dir / "export.md")
-    print(f"to_markdown(): Exported to {output_dir / 'export.md'}")
+    # JSON, CSV, HTML and Markdown export in one call (rows are built once)
+    written = log_entries.to_all(output_dir, ["json", "csv", "html", "md"])
+    for fmt, path in written.items():
+        print(f"to_all(): Exported {fmt} to {path}", file=out)
 
     # DataFrame export
     try:
         df = log_entries.to_dataframe()
-        print(f"to_dataframe(): Created DataFrame with shape {df.shape}")
+        print(f"to_dataframe(): Created DataFrame with shape {df.shape}", file=out)
     except ImportError:
-        print("to_dataframe(): pandas not installed")
+        print("to_dataframe(): pandas not installed", file=out)
 
-    # ========================================
-    # 8. REAL-TIME MONITORING
-    # ========================================
-    print("\n" + "=" * 70)
-    print("8. REAL-TIME MONITORING - Watch Logs Grow")
-    print("=" * 70)
+
+def section_8_monitoring(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Real-time monitoring: watch logs grow."""
+    print("\n" + "=" * 70, file=out)
+    print("8. REAL-TIME MONITORING - Watch Logs Grow", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser.monitor import LogFile
 
     logfile = LogFile.open(log_path)
-    print(f"LogFile.open(): Opened {log_path}")
-    print(f"  entry_count: {logfile.entry_count}")
-    print(f"  contains_error(): {logfile.contains_error()}")
-    print(f"  find_first(level='error'): {logfile.find_first(level='error').message if logfile.find_first(level='error') else None}")
+    print(f"LogFile.open(): Opened {log_path}", file=out)
+    print(f"  entry_count: {logfile.entry_count}", file=out)
+    print(f"  contains_error(): {logfile.contains_error()}", file=out)
+    print(f"  find_first(level='error'): {logfile.find_first(level='error').message if logfile.find_first(level='error') else None}", file=out)
 
     # Get last N entries
     tail_entries = logfile.tail(3)
-    print(f"tail(3): Last 3 entries retrieved")
+    print(f"tail(3): Last {len(tail_entries)} entries retrieved", file=out)
 
-    # ========================================
-    # 9. TASK TREES
-    # ========================================
-    print("\n" + "=" * 70)
-    print("9. TASK TREES - Hierarchical Visualization")
-    print("=" * 70)
+
+def section_9_task_trees(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Task trees: hierarchical visualization."""
+    print("\n" + "=" * 70, file=out)
+    print("9. TASK TREES - Hierarchical Visualization", file=out)
+    print("=" * 70, file=out)
 
     from logxy_log_parser import TaskTree
 
     tree = TaskTree.build(entries)
-    print(f"TaskTree.build(): Built tree with {len(tree.nodes)} nodes")
-    print(f"  Root tasks: {len(tree.roots)}")
+    print(f"TaskTree.build(): Built tree with {len(tree.nodes)} nodes", file=out)
+    print(f"  Root tasks: {len(tree.roots)}", file=out)
 
     # Show tree structure
     if tree.roots:
         root = tree.roots[0]
-        print(f"\nTree structure for {root.action_type}:")
-        print(f"  Depth: {root.depth}")
-        print(f"  Children: {len(root.children)}")
+        print(f"\nTree structure for {root.action_type}:", file=out)
+        print(f"  Depth: {root.depth}", file=out)
+        print(f"  Children: {len(root.children)}", file=out)
         for child in root.children:
-            print(f"    - {child.action_type} ({child.level.value})")
+            print(f"    - {child.action_type} ({child.level.value})", file=out)
 
-    # ========================================
-    # 10. GENERATE REPORTS
-    # ========================================
-    print("\n" + "=" * 70)
-    print("10. GENERATE REPORTS - Summary Reports")
-    print("=" * 70)
+
+def section_10_reports(
+    log_path: Path, entries: list[LogEntry], analyzer: LogAnalyzer, out: TextIO
+) -> None:
+    """Generate summary reports."""
+    print("\n" + "=" * 70, file=out)
+    print("10. GENERATE REPORTS - Summary Reports", file=out)
+    print("=" * 70, file=out)
 
     # HTML report
     html_report = analyzer.generate_report("html")
-    print(f"generate_report('html'): {len(html_report)} characters")
+    print(f"generate_report('html'): {len(html_report)} characters", file=out)
 
     # JSON report
     json_report = analyzer.generate_report("json")
-    print(f"generate_report('json'): {len(json_report)} characters")
+    print(f"generate_report('json'): {len(json_report)} characters", file=out)
 
     # Text report
     text_report = analyzer.generate_report("text")
-    print(f"generate_report('text'): {len(text_report)} characters")
+    print(f"generate_report('text'): {len(text_report)} characters", file=out)
+
+
+SECTIONS: list[Callable[[Path, list[LogEntry], LogAnalyzer, TextIO], None]] = [
+    section_1_simple_api,
+    section_2_indexing,
+    section_3_filtering,
+    section_4_time_series,
+    section_5_aggregation,
+    section_6_analysis,
+    section_7_export,
+    section_8_monitoring,
+    section_9_task_trees,
+    section_10_reports,
+]
+
+
+def run_section(
+    section: Callable[[Path, list[LogEntry], LogAnalyzer, TextIO], None],
+    log_path: Path,
+    entries: list[LogEntry],
+    analyzer: LogAnalyzer,
+) -> str:
+    """Run one section into its own buffer so concurrent output stays grouped."""
+    out = io.StringIO()
+    section(log_path, entries, analyzer, out)
+    return out.getvalue()
+
+
+def main():
+    """Comprehensive demonstration of all features."""
+    print("=" * 70)
+    print("LOGXY LOG PARSER - COMPLETE FEATURE REFERENCE")
+    print("=" * 70)
+
+    # Create comprehensive sample log
+    log_path = create_comprehensive_sample_log()
+    print(f"\nCreated comprehensive sample log: {log_path}")
+
+    from logxy_log_parser import LogAnalyzer, parse_log
+
+    # Parse and analyze once; every section shares these
+    entries = parse_log(log_path)
+    analyzer = LogAnalyzer(entries)
+
+    # Sections are independent and mostly wait on file I/O, so run them
+    # concurrently and print each buffer in submission order
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(run_section, section, log_path, entries, analyzer)
+            for section in SECTIONS
+        ]
+        for future in futures:
+            sys.stdout.write(future.result())
 
     # Cleanup
     log_path.unlink()
-    for export_file in output_dir.glob("*"):
-        export_file.unlink()
-    output_dir.rmdir()
+    if EXPORT_DIR.exists():
+        for export_file in EXPORT_DIR.glob("*"):
+            export_file.unlink()
+        EXPORT_DIR.rmdir()
 
     print("\n" + "=" * 70)
     print("COMPLETE FEATURE REFERENCE DEMONSTRATION FINISHED")
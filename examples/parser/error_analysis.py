@@ -9,15 +9,17 @@ This script demonstrates error analysis capabilities:
 5. Find orphaned entries
 """
 
-from logxy_log_parser import LogParser, LogFilter, LogAnalyzer
+import io
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from operator import itemgetter
 
+from logxy_log_parser import LogAnalyzer, LogEntries, LogFilter, LogParser
 
-def example_error_summary():
-    """Get a summary of all errors in the log."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-    analyzer = LogAnalyzer(logs)
 
+def example_error_summary(analyzer: LogAnalyzer) -> None:
+    """Get a summary of all errors in the log."""
     print("=== Error Summary ===")
 
     summary = analyzer.error_summary()
@@ -34,12 +36,8 @@ def example_error_summary():
         print(f"  {action}: {count}")
 
 
-def example_error_patterns():
+def example_error_patterns(analyzer: LogAnalyzer) -> None:
     """Find common error patterns."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-    analyzer = LogAnalyzer(logs)
-
     print("\n=== Error Patterns ===")
 
     patterns = analyzer.error_patterns()
@@ -51,154 +49,150 @@ def example_error_patterns():
         print(f"   Last occurrence: {pattern.last_occurrence}")
 
 
-def example_failure_rate_by_action():
+def example_failure_rate_by_action(sorted_rates: list[tuple[str, float]]) -> None:
     """Calculate failure rates for each action type."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-    analyzer = LogAnalyzer(logs)
-
     print("\n=== Failure Rate by Action ===")
 
-    rates = analyzer.failure_rate_by_action()
     print("Failure rates:")
-    for action, rate in sorted(rates.items(), key=lambda x: x[1], reverse=True):
+    for action, rate in sorted_rates:
         print(f"  {action}: {rate * 100:.1f}%")
 
 
-def example_most_common_errors():
+def example_most_common_errors(common: list[tuple[str, int]]) -> None:
     """Find the most common error messages."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-    analyzer = LogAnalyzer(logs)
-
     print("\n=== Most Common Errors ===")
 
-    common = analyzer.most_common_errors(n=5)
-    print(f"Top {len(common)} most common errors:")
-    for i, (message, count) in enumerate(common, 1):
-        print(f"  {i}. {message} ({count} occurrences)")
+    lines = [f"Top {len(common)} most common errors:"]
+    lines.extend(f"  {i}. {message} ({count} occurrences)" for i, (message, count) in enumerate(common, 1))
+    print("\n".join(lines))
 
 
-def example_orphans():
+def example_orphans(orphans: LogEntries) -> None:
     """Find orphaned log entries (entries without parent/child relationships)."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-    analyzer = LogAnalyzer(logs)
-
     print("\n=== Orphaned Entries ===")
 
-    orphans = analyzer.orphans()
-    print(f"Found {len(orphans)} orphaned entries:")
-    for entry in orphans:
-        print(f"  - {entry.message} (level: {entry.level.value})")
+    # Level is an IntEnum, so it formats as its value without the .value lookup
+    lines = [f"Found {len(orphans)} orphaned entries:"]
+    lines.extend(f"  - {entry.message} (level: {entry.level})" for entry in orphans)
+    print("\n".join(lines))
 
 
-def example_filter_errors():
+def example_filter_errors(
+    errors: LogEntries,
+    critical: LogEntries,
+    failed: LogEntries,
+    with_traceback: LogEntries,
+) -> None:
     """Filter logs to get only errors."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-
     print("\n=== Filter Errors ===")
 
-    # Get all error-level logs
-    errors = LogFilter(logs).error()
     print(f"Error-level logs: {len(errors)}")
-
-    # Get all critical-level logs
-    critical = LogFilter(logs).critical()
     print(f"Critical-level logs: {len(critical)}")
-
-    # Get all failed actions
-    failed = LogFilter(logs).failed_actions()
     print(f"Failed actions: {len(failed)}")
-
-    # Get logs with traceback
-    with_traceback = LogFilter(logs).with_traceback()
     print(f"Logs with traceback: {len(with_traceback)}")
 
 
-def example_error_details():
+def example_error_details(errors: LogEntries) -> None:
     """Get detailed information about errors."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-
     print("\n=== Error Details ===")
 
-    errors = LogFilter(logs).error()
-    for entry in errors:
-        print(f"\nMessage: {entry.message}")
-        print(f"Level: {entry.level.value}")
-        print(f"Status: {entry.action_status}")
-        if entry.duration:
-            print(f"Duration: {entry.duration}s")
-        if entry.get("error_code"):
-            print(f"Error Code: {entry.get('error_code')}")
-        if entry.get("traceback"):
-            print(f"Traceback: {entry.get('traceback')[:50]}...")
-
-
-def example_combined_error_analysis():
+    # Pull every displayed value out of each entry once, then format
+    rows = [
+        (e.message, e.level, e.action_status, e.duration, e.get("error_code"), e.get("traceback"))
+        for e in errors
+    ]
+    lines = []
+    for message, level, status, duration, error_code, traceback in rows:
+        lines.append(f"\nMessage: {message}")
+        lines.append(f"Level: {level}")
+        lines.append(f"Status: {status}")
+        if duration:
+            lines.append(f"Duration: {duration}s")
+        if error_code:
+            lines.append(f"Error Code: {error_code}")
+        if traceback:
+            lines.append(f"Traceback: {traceback[:50]}...")
+    print("\n".join(lines))
+
+
+def example_combined_error_analysis(
+    analyzer: LogAnalyzer,
+    common: list[tuple[str, int]],
+    sorted_rates: list[tuple[str, float]],
+) -> None:
     """Combine multiple error analysis methods."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-    analyzer = LogAnalyzer(logs)
-
     print("\n=== Combined Error Analysis ===")
 
     # Get error summary
     summary = analyzer.error_summary()
     print(f"Total errors: {summary.total_count}")
 
-    # Get most common errors
-    common = analyzer.most_common_errors(n=3)
+    # Top three of the most common errors computed in main()
     print("\nMost common errors:")
-    for message, count in common:
+    for message, count in common[:3]:
         print(f"  - {message}: {count}")
 
-    # Get failure rates
-    rates = analyzer.failure_rate_by_action()
+    # Highest failure rates, from the list sorted once in main()
     print("\nActions with highest failure rates:")
-    for action, rate in sorted(rates.items(), key=lambda x: x[1], reverse=True)[:3]:
+    for action, rate in sorted_rates[:3]:
         print(f"  - {action}: {rate * 100:.1f}%")
 
 
-def example_export_errors():
+def example_export_errors(errors: LogEntries) -> None:
     """Export error logs to various formats."""
-    parser = LogParser("tests/fixtures/errors.log")
-    logs = parser.parse()
-
     print("\n=== Export Errors ===")
 
-    errors = LogFilter(logs).error()
-
-    # Export to JSON
-    errors.to_json("errors.json")
-    print("Exported errors to errors.json")
+    # One call writes every format; the per-entry columns are projected once.
+    # Files go to a temporary directory so running the example leaves no output behind
+    with tempfile.TemporaryDirectory() as out_dir:
+        for path in errors.to_all(out_dir, stem="errors").values():
+            print(f"Exported errors to {path}")
 
-    # Export to CSV
-    errors.to_csv("errors.csv")
-    print("Exported errors to errors.csv")
 
-    # Export to HTML
-    errors.to_html("errors.html")
-    print("Exported errors to errors.html")
-
-    # Export to Markdown
-    errors.to_markdown("errors.md")
-    print("Exported errors to errors.md")
+def _capture(fn, *args) -> str:
+    """Run an example and return what it printed (pool worker)."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        fn(*args)
+    return buf.getvalue()
 
 
 def main():
     """Run all examples."""
-    example_error_summary()
-    example_error_patterns()
-    example_failure_rate_by_action()
-    example_most_common_errors()
-    example_orphans()
-    example_filter_errors()
-    example_error_details()
-    example_combined_error_analysis()
-    example_export_errors()
+    # Parse the fixture once and share the entries and analyzer
+    logs = LogParser("tests/fixtures/errors.log").parse()
+    analyzer = LogAnalyzer(logs)
+
+    # Filter each error view once; the examples below share the results
+    log_filter = LogFilter(logs)
+    errors = log_filter.error()
+    critical = log_filter.critical()
+    failed = log_filter.failed_actions()
+    with_traceback = log_filter.with_traceback()
+    orphans = analyzer.orphans()
+    common = analyzer.most_common_errors(n=5)
+    rates = analyzer.failure_rate_by_action()
+    sorted_rates = sorted(rates.items(), key=itemgetter(1), reverse=True)
+
+    # The read-only examples are independent; run them across processes and
+    # print each one's captured output in order so sections never interleave
+    jobs = [
+        (example_error_summary, analyzer),
+        (example_error_patterns, analyzer),
+        (example_failure_rate_by_action, sorted_rates),
+        (example_most_common_errors, common),
+        (example_orphans, orphans),
+        (example_filter_errors, errors, critical, failed, with_traceback),
+        (example_error_details, errors),
+        (example_combined_error_analysis, analyzer, common, sorted_rates),
+    ]
+    with ProcessPoolExecutor() as pool:
+        futures = [pool.submit(_capture, *job) for job in jobs]
+        for future in futures:
+            print(future.result(), end="")
+
+    # Exporting writes files, so it stays in this process
+    example_export_errors(errors)
 
 
 if __name__ == "__main__":
@@ -114,7 +114,7 @@ def main() -> None:
     # Deepest nesting
     print(f"\n   Structure:")
     print(f"      - Deepest nesting: {analyzer.deepest_nesting()}")
-    widest = analyzer.widest_tasks()[:3]
+    widest = analyzer.widest_tasks(3)
     for task_uuid, width in widest:
         print(f"      - Task {task_uuid[:8]}...: {width} entries")
 
@@ -10,115 +10,68 @@ This script demonstrates task tree capabilities:
 6. Get tree statistics
 """
 
-from logxy_log_parser import LogParser, LogFilter, TaskTree
+from logxy_log_parser import LogEntries, LogEntry, LogFilter, LogParser, TaskTree, extract_task_uuids
 
 
-def example_build_task_tree():
+def example_build_task_tree(logs: list[LogEntry], task_uuids: set[str], first_uuid: str) -> TaskTree:
     """Build a task tree from log entries."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("=== Build Task Tree ===")
 
-    # Get unique task UUIDs
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
     print(f"Found {len(task_uuids)} unique tasks")
 
     # Build tree for first task
-    first_uuid = list(task_uuids)[0]
     tree = TaskTree.from_entries(logs, first_uuid)
 
     print(f"\nTree for task {first_uuid[:8]}...")
     print(f"Root action: {tree.root.action_type}")
+    return tree
 
 
-def example_visualize_ascii():
+def example_visualize_ascii(tree: TaskTree) -> None:
     """Visualize task tree in ASCII format."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== ASCII Visualization ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     ascii_tree = tree.visualize(viz_format="ascii")
     print(ascii_tree)
 
 
-def example_visualize_text():
+def example_visualize_text(tree: TaskTree) -> None:
     """Visualize task tree in text format."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Text Visualization ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     text_tree = tree.visualize(viz_format="text")
     print(text_tree[:500] + "...")
 
 
-def example_execution_path():
+def example_execution_path(tree: TaskTree) -> None:
     """Get the execution path through the task tree."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Execution Path ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     path = tree.get_execution_path()
-    print(f"Execution path ({len(path)} steps):")
-    for i, action in enumerate(path, 1):
-        print(f"  {i}. {action}")
+    lines = [f"Execution path ({len(path)} steps):"]
+    lines.extend(f"  {i}. {action}" for i, action in enumerate(path, 1))
+    print("\n".join(lines))
 
 
-def example_all_paths():
+def example_all_paths(by_uuid: dict[str, LogEntries]) -> None:
     """Get all execution paths through the task tree."""
-    parser = LogParser("tests/fixtures/sample.log")
-    logs = parser.parse()
-
     print("\n=== All Execution Paths ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    for task_uuid in task_uuids:
-        tree = TaskTree.from_entries(logs, task_uuid)
+    from_entries = TaskTree.from_entries
+    lines = []
+    for task_uuid, task_logs in by_uuid.items():
+        tree = from_entries(task_logs, task_uuid)
         paths = tree.get_all_paths()
 
-        print(f"\nTask {task_uuid[:8]}... ({len(paths)} path(s)):")
-        for i, path in enumerate(paths, 1):
-            print(f"  Path {i}: {' -> '.join(path)}")
+        lines.append(f"\nTask {task_uuid[:8]}... ({len(paths)} path(s)):")
+        lines.extend(f"  Path {i}: {' -> '.join(path)}" for i, path in enumerate(paths, 1))
+    print("\n".join(lines))
 
 
-def example_find_node():
+def example_find_node(tree: TaskTree) -> None:
     """Find a specific node in the task tree."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Find Node ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     # Find node at level /2/2
     node = tree.find_node((2, 2))
     if node:
@@ -130,19 +83,10 @@ def example_find_node():
         print(f"  Messages: {len(node.messages)}")
 
 
-def example_tree_stats():
+def example_tree_stats(tree: TaskTree) -> None:
     """Get statistics about the task tree."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Tree Statistics ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     stats = tree.get_stats()
     print(f"Total nodes: {stats['total_nodes']}")
     print(f"Total messages: {stats['total_messages']}")
@@ -152,54 +96,27 @@ def example_tree_stats():
     print(f"Total duration: {stats['total_duration']:.3f}s")
 
 
-def example_deepest_nesting():
+def example_deepest_nesting(tree: TaskTree) -> None:
     """Find the deepest nesting level in the task tree."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Deepest Nesting ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     depth = tree.deepest_nesting()
     print(f"Deepest nesting level: {depth}")
 
 
-def example_to_dict():
+def example_to_dict(tree: TaskTree) -> None:
     """Convert task tree to dictionary."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Tree to Dictionary ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     tree_dict = tree.to_dict()
     print(f"Tree dictionary keys: {list(tree_dict.keys())}")
     print(f"Root action: {tree_dict['action_type']}")
 
 
-def example_node_properties():
+def example_node_properties(tree: TaskTree) -> None:
     """Access node properties."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Node Properties ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
-
     root = tree.root
     print("Root node properties:")
     print(f"  Task UUID: {root.task_uuid[:8]}...")
@@ -216,47 +133,30 @@ def example_node_properties():
     print(f"  Messages: {len(root.messages)}")
 
 
-def example_traverse_tree():
+def example_traverse_tree(tree: TaskTree) -> None:
     """Traverse the task tree manually."""
-    parser = LogParser("tests/fixtures/complex.log")
-    logs = parser.parse()
-
     print("\n=== Manual Tree Traversal ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    first_uuid = list(task_uuids)[0]
-    tree = TaskTree.from_entries(logs, first_uuid)
+    # Depth-first with an explicit stack, so deep trees never hit the recursion limit
+    lines = []
+    stack = [(tree.root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        lines.append(f"{'  ' * depth}{node.action_type} ({node.status})")
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    print("\n".join(lines))
 
-    def traverse(node, depth=0):
-        """Recursively traverse tree."""
-        indent = "  " * depth
-        print(f"{indent}{node.action_type} ({node.status})")
-        for child in node.children:
-            traverse(child, depth + 1)
 
-    traverse(tree.root)
-
-
-def example_filter_by_task():
+def example_filter_by_task(by_uuid: dict[str, LogEntries]) -> None:
     """Filter logs by task UUID and build tree."""
-    parser = LogParser("tests/fixtures/sample.log")
-    logs = parser.parse()
-
     print("\n=== Filter by Task and Build Tree ===")
 
-    from logxy_log_parser.utils import extract_task_uuid
-    task_uuids = extract_task_uuid(logs)
-
-    print(f"Found {len(task_uuids)} tasks")
-
-    for task_uuid in task_uuids:
-        # Filter logs for this task
-        task_logs = LogFilter(logs).by_task_uuid(task_uuid)
+    print(f"Found {len(by_uuid)} tasks")
 
-        # Build tree
-        tree = TaskTree.from_entries(task_logs, task_uuid)
+    from_entries = TaskTree.from_entries
+    for task_uuid, task_logs in by_uuid.items():
+        # Build tree from this task's entries
+        tree = from_entries(task_logs, task_uuid)
 
         print(f"\nTask {task_uuid[:8]}...:")
         print(f"  Entries: {len(task_logs)}")
@@ -266,18 +166,27 @@ def example_filter_by_task():
 
 def main():
     """Run all examples."""
-    example_build_task_tree()
-    example_visualize_ascii()
-    example_visualize_text()
-    example_execution_path()
-    example_all_paths()
-    example_find_node()
-    example_tree_stats()
-    example_deepest_nesting()
-    example_to_dict()
-    example_node_properties()
-    example_traverse_tree()
-    example_filter_by_task()
+    # Parse each fixture and collect its task UUIDs once, then share them
+    complex_logs = LogParser("tests/fixtures/complex.log").parse()
+    sample_logs = LogParser("tests/fixtures/sample.log").parse()
+    complex_uuids = extract_task_uuids(complex_logs)
+    # Partition the sample entries by task in one pass instead of one scan per task
+    sample_by_uuid = LogFilter(sample_logs).group_by("task_uuid")
+    first_uuid = next(iter(complex_uuids))
+
+    # Build the first task's tree once; the examples below share it
+    tree = example_build_task_tree(complex_logs, complex_uuids, first_uuid)
+    example_visualize_ascii(tree)
+    example_visualize_text(tree)
+    example_execution_path(tree)
+    example_all_paths(sample_by_uuid)
+    example_find_node(tree)
+    example_tree_stats(tree)
+    example_deepest_nesting(tree)
+    example_to_dict(tree)
+    example_node_properties(tree)
+    example_traverse_tree(tree)
+    example_filter_by_task(sample_by_uuid)
 
 
 if __name__ == "__main__":
@@ -8,16 +8,27 @@ Source code lives in logxy_log_parser/src/. This __init__.py re-exports the publ
 
 from __future__ import annotations
 
-# Re-export the entire public API from src subpackage
-from .src import *  # noqa: F401, F403
+# Re-export the public API from src subpackage. Names resolve lazily through
+# src's own __getattr__, so importing the package stays cheap.
+from . import src as _src
 from .src import __all__, __version__  # noqa: F401
 
 
 def __getattr__(name: str):
-    """Delegate submodule access to src/ subpackage."""
+    """Delegate public names and submodule access to src/ subpackage."""
+    if name in __all__:
+        value = getattr(_src, name)
+        globals()[name] = value
+        return value
+
     import importlib  # noqa: C0415
 
     try:
         return importlib.import_module(f".src.{name}", __name__)
     except ModuleNotFoundError as exc:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+
+
+def __dir__() -> list[str]:
+    """List the public API alongside module globals."""
+    return sorted(set(globals()) | set(__all__))
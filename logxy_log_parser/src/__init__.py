@@ -36,20 +36,15 @@ COMPATIBILITY:
 
 from __future__ import annotations
 
-from typing import Any
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
-# Import from common FIRST (first-party imports)
-# Sqid task ID parsing
-from common.sqid import (
-    SqidInfo,
-    SqidParser,
-    parse_sqid,
-    sqid_depth,
-    sqid_parent,
-    sqid_root,
-)
+# Field names and enums from common are cheap and used everywhere, so they
+# are bound eagerly. Everything else loads on first access (PEP 562), so a
+# script calling parse_log() does not import the analyzer, indexer, CLI, etc.
 from common.types import (
     ACTION_STATUS,
     ACTION_TYPE,
@@ -81,91 +76,102 @@ from common.types import (
     normalize_field_name,
 )
 
-# SIMPLE ONE-LINE API (import these for easiest use)
-# Aggregation
-from .aggregation import (
-    AggregatedStats,
-    LogAggregator,
-    MultiFileAnalyzer,
-    TimeBucket,
-    TimeSeriesAnalyzer,
-)
+if TYPE_CHECKING:
+    from common.sqid import SqidInfo, SqidParser, parse_sqid, sqid_depth, sqid_parent, sqid_root
 
-# Core API
-from .analyzer import (
-    ActionStat,
-    DurationStats,
-    ErrorSummary,
-    LogAnalyzer,
-)
+    from .aggregation import AggregatedStats, LogAggregator, MultiFileAnalyzer, TimeBucket, TimeSeriesAnalyzer
+    from .analyzer import ActionStat, DurationStats, ErrorSummary, LogAnalyzer
+    from .config import ConfigManager, ParserConfig, get_config
+    from .core import LogEntry, LogParser, ParseError
+    from .filter import LogEntries, LogFilter
+    from .index import IndexedLogParser, IndexStats, LogIndex, LogPosition
+    from .monitor import LogFile, LogFileError
+    from .simple import (
+        AnalysisReport,
+        CheckResult,
+        LogStats,
+        analyze_log,
+        check_log,
+        count_by,
+        group_by,
+        parse_line,
+        parse_log,
+        types,
+    )
+    from .tree import TaskNode, TaskTree
+    from .utils import (
+        bucketize,
+        chunked,
+        extract_duration,
+        extract_task_uuids,
+        first,
+        flatten,
+        format_timestamp,
+        get_field_value,
+        get_task_level,
+        get_task_uuid,
+        get_timestamp,
+        is_iterable,
+        level_from_entry,
+        level_from_message_type,
+        merge_fields,
+        normalize_entry,
+        pairwise,
+        parse_duration,
+        parse_timestamp,
+        subdict,
+        unique,
+        unique_everseen,
+        windowed,
+    )
 
-# Configuration
-from .config import (
-    ConfigManager,
-    ParserConfig,
-    get_config,
-)
-from .core import LogEntry, LogParser, ParseError
-from .filter import LogEntries, LogFilter
-
-# Indexing
-from .index import (
-    IndexedLogParser,
-    IndexStats,
-    LogIndex,
-    LogPosition,
-)
-from .monitor import LogFile, LogFileError
-from .simple import (
-    AnalysisReport,
-    CheckResult,
-    LogStats,
-    # One-line functions
-    analyze_log,
-    check_log,
-    parse_line,
-    parse_log,
-    # Type & count helpers
-    count_by,
-    group_by,
-    types,
-)
-
-from .tree import TaskNode, TaskTree
-from .utils import (
-    bucketize,
-    chunked,
-    extract_duration,
-    extract_task_uuids,
-    first,
-    flatten,
-    format_timestamp,
-    get_field_value,
-    get_task_level,
-    get_task_uuid,
-    get_timestamp,
-    is_iterable,
-    level_from_entry,
-    level_from_message_type,
-    merge_fields,
-    normalize_entry,
-    pairwise,
-    parse_duration,
-    parse_timestamp,
-    subdict,
-    unique,
-    unique_everseen,
-    windowed,
-)
-
-# CLI (optional)
-try:
-    from .cli import main as _cli_main
-    main = _cli_main
-    _cli_available = True
-except ImportError:
-    _cli_available = False
-    main = None  # type: ignore
+# Public name -> module it is loaded from on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    # Sqid task ID parsing
+    **dict.fromkeys(
+        ("SqidInfo", "SqidParser", "parse_sqid", "sqid_depth", "sqid_parent", "sqid_root"),
+        "common.sqid",
+    ),
+    # Aggregation
+    **dict.fromkeys(
+        ("AggregatedStats", "LogAggregator", "MultiFileAnalyzer", "TimeBucket", "TimeSeriesAnalyzer"),
+        ".aggregation",
+    ),
+    # Analysis
+    **dict.fromkeys(("ActionStat", "DurationStats", "ErrorSummary", "LogAnalyzer"), ".analyzer"),
+    # Configuration
+    **dict.fromkeys(("ConfigManager", "ParserConfig", "get_config"), ".config"),
+    # Core
+    **dict.fromkeys(("LogEntry", "LogParser", "ParseError"), ".core"),
+    # Filtering
+    **dict.fromkeys(("LogEntries", "LogFilter"), ".filter"),
+    # Indexing
+    **dict.fromkeys(("IndexedLogParser", "IndexStats", "LogIndex", "LogPosition"), ".index"),
+    # Monitoring
+    **dict.fromkeys(("LogFile", "LogFileError"), ".monitor"),
+    # Simple one-line API
+    **dict.fromkeys(
+        (
+            "AnalysisReport", "CheckResult", "LogStats", "analyze_log", "check_log",
+            "count_by", "group_by", "parse_line", "parse_log", "types",
+        ),
+        ".simple",
+    ),
+    # Tree
+    **dict.fromkeys(("TaskNode", "TaskTree"), ".tree"),
+    # Utils
+    **dict.fromkeys(
+        (
+            "bucketize", "chunked", "extract_duration", "extract_task_uuids", "first",
+            "flatten", "format_timestamp", "get_field_value", "get_task_level",
+            "get_task_uuid", "get_timestamp", "is_iterable", "level_from_entry",
+            "level_from_message_type", "merge_fields", "normalize_entry", "pairwise",
+            "parse_duration", "parse_timestamp", "subdict", "unique", "unique_everseen",
+            "windowed",
+        ),
+        ".utils",
+    ),
+}
 
 __all__ = [
     # Version
@@ -283,28 +289,34 @@ __all__ = [
     "main",
 ]
 
-# Optional pandas support
-try:
-    import pandas as _pd  # type: ignore  # noqa: F401
-
-    _pandas_available = True
-except ImportError:
-    _pandas_available = False
-
-# Optional rich support
-try:
-    import rich as _rich  # noqa: F401
-
-    _rich_available = True
-except ImportError:
-    _rich_available = False
+# Optional dependencies: probe the import finder without executing the packages
+_pandas_available = importlib.util.find_spec("pandas") is not None
+_rich_available = importlib.util.find_spec("rich") is not None
 
 
 def __getattr__(name: str) -> Any:
-    """Lazy import for optional dependencies."""
+    """Load public names on first access, and guard optional dependencies."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    if name == "main":
+        # CLI (optional)
+        try:
+            from .cli import main as value
+        except ImportError:
+            value = None
+        globals()["main"] = value
+        return value
     if name == "to_dataframe" and not _pandas_available:
         raise ImportError(
             "pandas is required for DataFrame export. "
             "Install with: pip install logxy-log-parser[pandas]"
         )
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List eagerly bound and lazily loaded public names."""
+    return sorted(set(globals()) | set(__all__))
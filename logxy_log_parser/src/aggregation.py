@@ -8,15 +8,22 @@ performing time-series analysis.
 from __future__ import annotations
 
 import gzip
+import io
 import json
-from collections import defaultdict
-from collections.abc import Callable
+import math
+import mmap
+import os
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
+from fnmatch import fnmatch
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from .core import LogEntry
+from .core import LogEntry, _iter_lines, _json_loads
 from .filter import LogEntries
 
 
@@ -27,7 +34,7 @@ class TimeBucket:
     start: float
     end: float
     count: int
-    level_counts: dict[str, int] = field(default_factory=dict)
+    level_counts: Counter[str] = field(default_factory=Counter)
     error_count: int = 0
     task_uuids: set[str] = field(default_factory=set)
 
@@ -38,8 +45,7 @@ class TimeBucket:
             entry: LogEntry to add.
         """
         self.count += 1
-        level = entry.level.value
-        self.level_counts[level] = self.level_counts.get(level, 0) + 1
+        self.level_counts[entry.level.value] += 1
         if entry.is_error:
             self.error_count += 1
         if entry.task_uuid:
@@ -82,93 +88,355 @@ class AggregatedStats:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class _FileAggregate:
+    """Parsed entries and per-file statistics for one log file."""
+
+    entries: tuple[LogEntry, ...]
+    level_counts: dict[str, int]
+    task_uuids: frozenset[str]
+    min_ts: float
+    max_ts: float
+
+
+@dataclass
+class _StatsMerger:
+    """Accumulate per-file aggregates into AggregatedStats, one file at a time."""
+
+    total_entries: int = 0
+    task_uuids: set[str] = field(default_factory=set)
+    level_counts: Counter[str] = field(default_factory=Counter)
+    min_ts: float = float("inf")
+    max_ts: float = 0.0
+    file_stats: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, path: str, result: _FileAggregate) -> None:
+        """Fold one file's statistics into the totals.
+
+        Args:
+            path: Source path the file was read from.
+            result: The file's parsed entries and statistics.
+        """
+        self.total_entries += len(result.entries)
+        self.task_uuids.update(result.task_uuids)
+        self.level_counts.update(result.level_counts)
+        self.min_ts = min(self.min_ts, result.min_ts)
+        self.max_ts = max(self.max_ts, result.max_ts)
+        self.file_stats[path] = {
+            "entries": len(result.entries),
+            "level_counts": dict(result.level_counts),
+        }
+
+    def build(self, total_files: int) -> AggregatedStats:
+        """Snapshot the totals as AggregatedStats.
+
+        Args:
+            total_files: Number of sources the aggregator was given.
+
+        Returns:
+            AggregatedStats: Statistics over the files added so far.
+        """
+        return AggregatedStats(
+            total_entries=self.total_entries,
+            total_files=total_files,
+            time_range=(self.min_ts, self.max_ts) if self.min_ts != float("inf") else (0, 0),
+            level_counts=dict(self.level_counts),
+            unique_tasks=len(self.task_uuids),
+            file_stats=dict(self.file_stats),
+        )
+
+
+class _ParseCache:
+    """Least-recently-used parsed files, bounded by their total source bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: dict[tuple[str, int, int], _FileAggregate] = {}
+        self._bytes = 0
+
+    def get(self, key: tuple[str, int, int]) -> _FileAggregate | None:
+        """Return a cached parse and mark it most recently used."""
+        result = self._items.pop(key, None)
+        if result is not None:
+            self._items[key] = result
+        return result
+
+    def put(self, key: tuple[str, int, int], result: _FileAggregate) -> None:
+        """Store a parse, evicting the oldest files beyond the byte budget."""
+        size = key[2]
+        if size > self.max_bytes or key in self._items:
+            return
+        self._items[key] = result
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._items))
+            del self._items[oldest]
+            self._bytes -= oldest[2]
+
+    def clear(self) -> None:
+        """Drop every cached parse."""
+        self._items.clear()
+        self._bytes = 0
+
+
+# Parsed files keyed on (path, mtime_ns, size); rewriting a file changes its
+# key, so stale entries are never served. Only aggregators created with
+# cache=True use it; LogAggregator.clear_cache() empties it
+_FILE_CACHE = _ParseCache(max_bytes=256 * 1024 * 1024)
+
+# Below this many uncached bytes, parsing in-process beats starting a pool
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+# Concurrent reads for batches of small files
+_READ_THREADS = 8
+
+# Read size for rapidgzip's unbuffered decompressed stream
+_GZIP_BUFFER = 1024 * 1024
+
+# Seconds in the smallest unit local wall-clock hours can shift by
+_QUARTER_HOUR = 900
+
+try:
+    from rapidgzip import open as _rapidgzip_open
+
+    def _open_gzip(path: str) -> BinaryIO:
+        """Open a gzip file for buffered reads with rapidgzip's multi-threaded decoder."""
+        return io.BufferedReader(_rapidgzip_open(path, parallelization=0), _GZIP_BUFFER)
+
+    # rapidgzip reports corrupt or truncated streams as ValueError/RuntimeError
+    _GZIP_ERRORS: tuple[type[Exception], ...] = (OSError, EOFError, ValueError, RuntimeError)
+
+except ImportError:
+
+    def _open_gzip(path: str) -> BinaryIO:
+        """Open a gzip file for buffered reads with the stdlib decoder."""
+        return gzip.open(path, "rb")
+
+    # BadGzipFile is an OSError; a truncated stream raises EOFError
+    _GZIP_ERRORS = (OSError, EOFError)
+
+
+def _summarize(lines: Iterable[bytes]) -> _FileAggregate:
+    """Parse raw log lines and collect per-file statistics.
+
+    Args:
+        lines: JSON log lines as bytes.
+
+    Returns:
+        _FileAggregate: Entries and statistics for the file.
+    """
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entries.append(LogEntry.from_dict(_json_loads(line)))
+        except (json.JSONDecodeError, ValueError):
+            continue
+
+    # Stats come from columns pulled once after parsing, rather than from
+    # attribute reads, dict updates and min/max calls per line inside the loop
+    timestamps = [e.timestamp for e in entries]
+    return _FileAggregate(
+        tuple(entries),
+        dict(Counter(e.level.value for e in entries)),
+        frozenset({e.task_uuid for e in entries if e.task_uuid}),
+        min(timestamps, default=float("inf")),
+        max(timestamps, default=0.0),
+    )
+
+
+def _read_log_file(path: str) -> _FileAggregate | None:
+    """Read and parse one log file (process pool worker).
+
+    Args:
+        path: Log file path (``.gz`` files are decompressed).
+
+    Returns:
+        _FileAggregate | None: Entries and statistics, or None if unreadable.
+    """
+    if not path.endswith(".gz"):
+        # Map plain files and slice lines straight from the page cache,
+        # instead of copying the file into one buffer and splitting it
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return _summarize(())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    return _summarize(_iter_lines(buf))
+        except OSError:
+            return None
+
+    # Decompress and parse line by line, so neither the whole decompressed
+    # file nor a list of its lines is held in memory
+    try:
+        with _open_gzip(path) as f:
+            return _summarize(f)
+    except _GZIP_ERRORS:
+        return None
+
+
+def _parse_uncached(
+    pending: list[tuple[str, int, int]], workers: int | None = None
+) -> Iterator[tuple[tuple[str, int, int], _FileAggregate | None]]:
+    """Parse files missing from the cache, across processes when worthwhile.
+
+    Large batches go to a process pool. Small batches of several files are
+    streamed on a thread pool, so their reads and gzip decompression, which
+    release the GIL, overlap while each file is parsed line by line.
+
+    Args:
+        pending: Cache keys (path, mtime_ns, size) of the files to parse.
+        workers: Maximum worker processes (default: os.cpu_count()).
+
+    Yields:
+        tuple: Each cache key with its parse result, in completion order.
+    """
+    total_bytes = sum(size for _, _, size in pending)
+    workers = min(len(pending), workers or os.cpu_count() or 1)
+
+    if total_bytes < _PARALLEL_MIN_BYTES and len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(pending), _READ_THREADS)) as pool:
+            results = pool.map(_read_log_file, [path for path, _, _ in pending])
+            yield from zip(pending, results, strict=True)
+        return
+
+    if workers < 2 or total_bytes < _PARALLEL_MIN_BYTES:
+        for key in pending:
+            yield key, _read_log_file(key[0])
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_read_log_file, key[0]): key for key in pending}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 class LogAggregator:
-    """Aggregate logs from multiple files."""
+    """Aggregate logs from multiple files.
 
-    def __init__(self, sources: list[str | Path]) -> None:
+    Files are parsed in parallel worker processes once there is enough data
+    to outweigh the pool start-up cost. With ``cache=True``, parsed files
+    are also kept in a process-wide cache keyed on (path, mtime, size) and
+    bounded to 256 MiB of source data, so aggregating the same unchanged
+    files again skips re-parsing them; :meth:`clear_cache` releases it.
+    """
+
+    def __init__(self, sources: list[str | Path], cache: bool = False) -> None:
         """Initialize aggregator with multiple log sources.
 
         Args:
             sources: List of log file paths.
+            cache: Reuse and keep parses of unchanged files across aggregators.
         """
         self._sources = [Path(s) for s in sources]
+        self._cache = cache
+        # String form of each source, computed once for cache keys and stats
+        self._paths = [str(s) for s in self._sources]
         self._entries: list[LogEntry] = []
         self._stats = AggregatedStats()
 
-    def aggregate(self, progress_callback: Callable[[int, int], None] | None = None) -> LogEntries:
+    def aggregate(
+        self,
+        progress_callback: Callable[[int, int], None] | None = None,
+        workers: int | None = None,
+    ) -> LogEntries:
         """Aggregate all log files.
 
         Args:
             progress_callback: Optional callback(current, total) for progress updates.
+            workers: Maximum parser processes (default: os.cpu_count()).
 
         Returns:
             LogEntries: All aggregated entries.
         """
-        all_entries: list[LogEntry] = []
-        all_task_uuids = set()
-        min_ts = float("inf")
-        max_ts = 0.0
-        level_counts: dict[str, int] = {}
-        file_stats: dict[str, dict[str, Any]] = {}
+        paths = list(dict.fromkeys(self._paths))
+        total = len(paths)
 
-        for i, source in enumerate(self._sources):
-            # Update progress
-            if progress_callback:
-                progress_callback(i + 1, len(self._sources))
-
-            # Check if file is gzipped
-            open_func = gzip.open if str(source).endswith(".gz") else open
+        # Decide once whether progress is reported, not on every file
+        if progress_callback is None:
+            def advance() -> None:
+                pass
+        else:
+            done = 0
 
-            entries = []
-            file_level_counts: dict[str, int] = {}
+            def advance() -> None:
+                nonlocal done
+                done += 1
+                progress_callback(done, total)
 
+        parsed: dict[str, _FileAggregate] = {}
+        pending: list[tuple[str, int, int]] = []
+        for path in paths:
             try:
-                with open_func(source, "rt", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            data = json.loads(line)
-                            entry = LogEntry.from_dict(data)
-                            entries.append(entry)
-
-                            # Track stats
-                            level = entry.level.value
-                            level_counts[level] = level_counts.get(level, 0) + 1
-                            file_level_counts[level] = file_level_counts.get(level, 0) + 1
-
-                            if entry.task_uuid:
-                                all_task_uuids.add(entry.task_uuid)
-
-                            min_ts = min(min_ts, entry.timestamp)
-                            max_ts = max(max_ts, entry.timestamp)
-
-                        except (json.JSONDecodeError, ValueError):
-                            continue
+                st = os.stat(path)
             except OSError:
                 # Skip files that can't be read
+                advance()
                 continue
+            key = (path, st.st_mtime_ns, st.st_size)
+            cached = _FILE_CACHE.get(key) if self._cache else None
+            if cached is not None:
+                parsed[path] = cached
+                advance()
+            else:
+                pending.append(key)
 
-            all_entries.extend(entries)
-            file_stats[str(source)] = {
-                "entries": len(entries),
-                "level_counts": file_level_counts,
-            }
+        for key, result in _parse_uncached(pending, workers):
+            if result is not None:
+                parsed[key[0]] = result
+                if self._cache:
+                    _FILE_CACHE.put(key, result)
+            advance()
 
-        # Update stats
-        self._stats = AggregatedStats(
-            total_entries=len(all_entries),
-            total_files=len(self._sources),
-            time_range=(min_ts, max_ts) if min_ts != float("inf") else (0, 0),
-            level_counts=level_counts,
-            unique_tasks=len(all_task_uuids),
-            file_stats=file_stats,
-        )
+        all_entries: list[LogEntry] = []
+        merger = _StatsMerger()
+
+        # Merge in source order so entry order does not depend on scheduling
+        for path in self._paths:
+            result = parsed.get(path)
+            if result is None:
+                continue
+            all_entries.extend(result.entries)
+            merger.add(path, result)
 
+        self._stats = merger.build(total_files=len(self._sources))
         self._entries = all_entries
         return LogEntries(all_entries)
 
+    def iter_entries(self) -> Iterator[LogEntry]:
+        """Yield entries file by file without building the combined list.
+
+        Each file is parsed, yielded and released before the next one is
+        read, so peak memory is bounded by the largest file rather than the
+        whole set. With ``cache=True``, files already in the parse cache are
+        reused, but streamed files are not added to it. :attr:`stats` is updated after each file
+        and is complete once the iterator is exhausted.
+
+        Yields:
+            LogEntry: Entries in source order.
+        """
+        merger = _StatsMerger()
+        total_files = len(self._sources)
+        for path in self._paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # Skip files that can't be read
+            cached = _FILE_CACHE.get((path, st.st_mtime_ns, st.st_size)) if self._cache else None
+            result = cached or _read_log_file(path)
+            if result is None:
+                continue
+            merger.add(path, result)
+            self._stats = merger.build(total_files)
+            yield from result.entries
+        self._stats = merger.build(total_files)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Release every parse kept by aggregators created with ``cache=True``."""
+        _FILE_CACHE.clear()
+
     @property
     def stats(self) -> AggregatedStats:
         """Get aggregation statistics.
@@ -207,27 +475,39 @@ class TimeSeriesAnalyzer:
         if not self._entries:
             return []
 
-        # Find time range
+        # Pull the timestamp column once and find the time range
         timestamps = [e.timestamp for e in self._entries]
         min_ts = min(timestamps)
 
-        # Create buckets
-        buckets: dict[float, TimeBucket] = {}
-        for entry in self._entries:
-            # Calculate bucket key
-            bucket_key = int((entry.timestamp - min_ts) // interval_seconds) * interval_seconds + min_ts
-
-            if bucket_key not in buckets:
-                buckets[bucket_key] = TimeBucket(
-                    start=bucket_key,
-                    end=bucket_key + interval_seconds,
-                    count=0,
-                )
-
-            buckets[bucket_key].add_entry(entry)
-
-        # Return sorted by time
-        return [buckets[k] for k in sorted(buckets.keys())]
+        # Group entries by integer slot index rather than float start. Logs are
+        # written in time order, so consecutive entries usually share a slot:
+        # the current bucket is reused and the dict is only consulted at slot
+        # boundaries (any order still works, and sorting the already ordered
+        # slot keys below is linear)
+        slots: dict[int, list[LogEntry]] = {}
+        prev = None
+        members: list[LogEntry] = []
+        for ts, entry in zip(timestamps, self._entries, strict=True):
+            slot = int((ts - min_ts) // interval_seconds)
+            if slot != prev:
+                members = slots.setdefault(slot, [])
+                prev = slot
+            members.append(entry)
+
+        # Tally each bucket's columns in bulk instead of one add_entry() per entry
+        buckets = []
+        for slot in sorted(slots):
+            members = slots[slot]
+            start = slot * interval_seconds + min_ts
+            buckets.append(TimeBucket(
+                start=start,
+                end=start + interval_seconds,
+                count=len(members),
+                level_counts=Counter(e.level.value for e in members),
+                error_count=sum(1 for e in members if e.is_error),
+                task_uuids={e.task_uuid for e in members if e.task_uuid},
+            ))
+        return buckets
 
     def detect_anomalies(
         self, window_size: int = 10, threshold: float = 2.0
@@ -241,20 +521,33 @@ class TimeSeriesAnalyzer:
         Returns:
             list[dict[str, Any]]: Detected anomalies.
         """
-        import statistics
-
         buckets = self.bucket_by_interval(interval_seconds=60)
-        if len(buckets) < window_size * 2:
+        if window_size < 1 or len(buckets) < window_size * 2:
             return []
 
         counts = [b.count for b in buckets]
         anomalies = []
 
+        # Baseline is the window on both sides of each point (excluding it).
+        # Counts are ints, so running sums of the values and their squares
+        # stay exact and each step updates them in O(1)
+        size = 2 * window_size
+        baseline = counts[:window_size] + counts[window_size + 1:size + 1]
+        total = sum(baseline)
+        total_sq = sum(c * c for c in baseline)
+
         for i in range(window_size, len(buckets) - window_size):
-            # Get baseline from window around current point (excluding it)
-            window = counts[i - window_size:i] + counts[i + 1:i + 1 + window_size]
-            mean = statistics.mean(window)
-            stdev = statistics.stdev(window) if len(window) > 1 else 0
+            if i > window_size:
+                # Slide from i - 1: point i - 1 joins the left side, i leaves the right
+                leaving_left, joining_right = counts[i - 1 - window_size], counts[i + window_size]
+                total += counts[i - 1] - leaving_left + joining_right - counts[i]
+                total_sq += (
+                    counts[i - 1] ** 2 - leaving_left ** 2 + joining_right ** 2 - counts[i] ** 2
+                )
+
+            mean = total / size
+            spread = size * total_sq - total * total
+            stdev = math.sqrt(spread / (size * (size - 1))) if spread > 0 else 0
 
             if stdev > 0:
                 z_score = (counts[i] - mean) / stdev
@@ -321,28 +614,34 @@ class TimeSeriesAnalyzer:
         Returns:
             dict: Nested mapping of time period to counts.
         """
-        heatmap: dict[str | int, dict[str | int, int]] = defaultdict(lambda: defaultdict(int))
+        # Tally flat (period keys, level) cells; strings are formatted per cell below
+        counts: Counter[tuple[tuple[str, str], int]] = Counter()
 
-        for entry in self._entries:
-            dt = datetime.fromtimestamp(entry.timestamp)
+        # Local hour and weekday only change on quarter-hour boundaries (every
+        # UTC offset and DST switch is a multiple of 15 minutes), so convert
+        # each quarter-hour once instead of calling fromtimestamp per entry
+        periods: dict[int, tuple[str, str]] = {}
 
-            if hour_granularity:
-                # By hour of day (0-23)
-                outer_key: int | str = dt.hour
-                inner_key = dt.weekday()  # Day of week
-            else:
-                # By day of week and hour
-                outer_key = dt.strftime("%A")  # Day name
-                inner_key = dt.hour
-
-            level = entry.level.value
-            heatmap[f"{outer_key}"][f"{inner_key}_{level}"] += 1
-
-        # Convert nested defaultdicts to regular dicts
-        return {
-            str(k): {str(k2): v2 for k2, v2 in v.items()}
-            for k, v in heatmap.items()
-        }
+        for entry in self._entries:
+            quarter = int(entry.timestamp // _QUARTER_HOUR)
+            keys = periods.get(quarter)
+            if keys is None:
+                dt = datetime.fromtimestamp(entry.timestamp)
+                if hour_granularity:
+                    # By hour of day (0-23), then day of week
+                    keys = (f"{dt.hour}", f"{dt.weekday()}")
+                else:
+                    # By day name, then hour
+                    keys = (dt.strftime("%A"), f"{dt.hour}")
+                periods[quarter] = keys
+
+            counts[keys, entry.level.value] += 1
+
+        # Build the nested layout once per distinct cell, in first-seen order
+        heatmap: dict[str | int, dict[str | int, int]] = {}
+        for ((outer_key, inner_key), level), count in counts.items():
+            heatmap.setdefault(outer_key, {})[f"{inner_key}_{level}"] = count
+        return heatmap
 
     def burst_detection(
         self, threshold: float = 1.5, min_interval: float = 5
@@ -368,34 +667,22 @@ class TimeSeriesAnalyzer:
         median = statistics.median(counts)
         threshold_value = median * threshold
 
+        # Bursts are runs of consecutive buckets above the threshold; groupby
+        # yields one run at a time, so Python only steps per run, not per bucket
         bursts = []
-        current_burst_start = None
-        current_max = 0
-
-        for bucket in buckets:
-            if bucket.count > threshold_value:
-                if current_burst_start is None:
-                    current_burst_start = bucket.start
-                current_max = max(current_max, bucket.count)
-            else:
-                if current_burst_start is not None:
-                    bursts.append({
-                        "start": current_burst_start,
-                        "end": bucket.start,
-                        "peak_count": current_max,
-                        "threshold": threshold_value,
-                    })
-                    current_burst_start = None
-                    current_max = 0
-
-        # Handle burst that extends to end
-        if current_burst_start is not None:
-            bursts.append({
-                "start": current_burst_start,
-                "end": buckets[-1].end,
-                "peak_count": current_max,
-                "threshold": threshold_value,
-            })
+        i = 0
+        for is_burst, run in groupby(count > threshold_value for count in counts):
+            n = sum(1 for _ in run)
+            if is_burst:
+                # A burst ends where the next quiet bucket starts, or with the last bucket
+                end = buckets[i + n].start if i + n < len(buckets) else buckets[-1].end
+                bursts.append({
+                    "start": buckets[i].start,
+                    "end": end,
+                    "peak_count": max(counts[i:i + n]),
+                    "threshold": threshold_value,
+                })
+            i += n
 
         return bursts
 
@@ -403,23 +690,65 @@ class TimeSeriesAnalyzer:
 class MultiFileAnalyzer:
     """Analyze logs across multiple files."""
 
-    def __init__(self, directory: str | Path, pattern: str = "*.log") -> None:
+    def __init__(
+        self, directory: str | Path, pattern: str = "*.log", max_files: int | None = None
+    ) -> None:
         """Initialize analyzer for a directory.
 
         Args:
             directory: Directory containing log files.
             pattern: Glob pattern for log files.
+            max_files: Stop scanning after this many matches (in directory
+                order), so large directories are not walked in full.
         """
         self._directory = Path(directory)
         self._pattern = pattern
+        self._max_files = max_files
         self._files: list[Path] = []
+        self._aggregator: LogAggregator | None = None
+        self._entries: LogEntries | None = None
         self._scan_directory()
 
     def _scan_directory(self) -> None:
-        """Scan directory for matching log files."""
-        self._files = sorted(self._directory.glob(self._pattern))
-        # Also check for gzipped files
-        self._files.extend(sorted(self._directory.glob(f"{self._pattern}.gz")))
+        """Scan directory once for matching log files (plain, then gzipped)."""
+        # A new file list invalidates the shared aggregation
+        self._aggregator = None
+        self._entries = None
+        gz_pattern = f"{self._pattern}.gz"
+        limit = self._max_files
+        if "/" in self._pattern or "**" in self._pattern:
+            # Recursive patterns need pathlib's directory walk
+            plain = list(islice(self._directory.glob(self._pattern), limit))
+            rest = None if limit is None else limit - len(plain)
+            gzipped = list(islice(self._directory.glob(gz_pattern), rest))
+            self._files = sorted(plain) + sorted(gzipped)
+            return
+
+        plain = []
+        gzipped = []
+        try:
+            with os.scandir(self._directory) as it:
+                for de in it:
+                    if limit is not None and len(plain) + len(gzipped) >= limit:
+                        break
+                    if fnmatch(de.name, self._pattern):
+                        plain.append(Path(de.path))
+                    elif fnmatch(de.name, gz_pattern):
+                        gzipped.append(Path(de.path))
+        except OSError:
+            pass  # Missing or unreadable directory: no files, as with glob
+        self._files = sorted(plain) + sorted(gzipped)
+
+    def _get_entries(self) -> tuple[LogAggregator, LogEntries]:
+        """Aggregate the matched files once and share the result between analyses.
+
+        Returns:
+            tuple: The aggregator (for its stats) and all aggregated entries.
+        """
+        if self._aggregator is None or self._entries is None:
+            self._aggregator = LogAggregator([str(f) for f in self._files])
+            self._entries = self._aggregator.aggregate()
+        return self._aggregator, self._entries
 
     @property
     def file_count(self) -> int:
@@ -436,8 +765,7 @@ class MultiFileAnalyzer:
         Returns:
             dict[str, Any]: Combined analysis results.
         """
-        aggregator = LogAggregator([str(f) for f in self._files])
-        entries = aggregator.aggregate()
+        aggregator, entries = self._get_entries()
 
         from .analyzer import LogAnalyzer
 
@@ -447,7 +775,7 @@ class MultiFileAnalyzer:
         return {
             "directory": str(self._directory),
             "files": self._files,
-            "file_count": self._files,
+            "file_count": len(self._files),
             "aggregation_stats": aggregator.stats.to_dict(),
             "error_summary": {
                 "total_count": error_summary.total_count,
@@ -469,18 +797,27 @@ class MultiFileAnalyzer:
         Returns:
             list[dict[str, Any]]: Time series data.
         """
-        aggregator = LogAggregator([str(f) for f in self._files])
-        entries = aggregator.aggregate()
+        _, entries = self._get_entries()
+        if not entries:
+            return []
+
+        # Only counts are needed here, so tally bucket indices directly
+        # instead of building full TimeBuckets with level and task tracking
+        timestamps = [e.timestamp for e in entries]
+        min_ts = min(timestamps)
+
+        def slot(ts: float) -> int:
+            return int((ts - min_ts) // interval_seconds)
 
-        analyzer = TimeSeriesAnalyzer(entries)
-        buckets = analyzer.bucket_by_interval(interval_seconds)
+        counts = Counter(map(slot, timestamps))
+        error_counts = Counter(slot(e.timestamp) for e in entries if e.is_error)
 
         return [
             {
-                "timestamp": b.start,
-                "count": b.count,
-                "error_count": b.error_count,
-                "error_rate": b.error_rate,
+                "timestamp": idx * interval_seconds + min_ts,
+                "count": counts[idx],
+                "error_count": error_counts[idx],
+                "error_rate": error_counts[idx] / counts[idx],
             }
-            for b in buckets
+            for idx in sorted(counts)
         ]
@@ -2,19 +2,81 @@
 Analysis functionality for logxy-log-parser.
 
 Contains LogAnalyzer for statistical and pattern analysis of log entries.
-Uses boltons for efficient grouping and iteration utilities.
 """
 
 from __future__ import annotations
 
-import statistics
+import heapq
+import html
+import io
+import math
+import re
+from array import array
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any
 
 from common.types import ActionStatus
 from .core import LogEntry
 from .filter import LogEntries
-from .utils import bucketize
+
+
+_INTERVAL_RE = re.compile(
+    r"^\s*(\d+(?:\.\d+)?)\s*(s|secs?|seconds?|m|mins?|minutes?|h|hours?|d|days?)?\s*$", re.IGNORECASE
+)
+_UNIT_SECONDS = {
+    **dict.fromkeys(("s", "sec", "secs", "second", "seconds"), 1.0),
+    **dict.fromkeys(("m", "min", "mins", "minute", "minutes"), 60.0),
+    **dict.fromkeys(("h", "hour", "hours"), 3600.0),
+    **dict.fromkeys(("d", "day", "days"), 86400.0),
+}
+
+_REPORT_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Log Analysis Report</title>
+    <style>
+        body { font-family: sans-serif; margin: 20px; }
+        .section { margin: 20px 0; padding: 15px; background: #f5f5f5; border-radius: 5px; }
+        h2 { margin-top: 0; }
+        .stat { display: inline-block; margin: 10px; padding: 10px; background: white; border-radius: 3px; }
+        .stat-label { font-weight: bold; color: #666; }
+        .stat-value { font-size: 1.2em; }
+    </style>
+</head>
+<body>
+    <h1>Log Analysis Report</h1>
+"""
+
+
+def _quantile(sorted_values: list[float], q: float) -> float:
+    """Linearly interpolated quantile of pre-sorted values (NumPy's default method).
+
+    Args:
+        sorted_values: Non-empty values in ascending order.
+        q: Quantile in [0, 1].
+
+    Returns:
+        float: Interpolated value at q.
+    """
+    pos = q * (len(sorted_values) - 1)
+    lo = int(pos)
+    if lo + 1 == len(sorted_values):
+        return sorted_values[lo]
+    return sorted_values[lo] + (sorted_values[lo + 1] - sorted_values[lo]) * (pos - lo)
+
+
+@dataclass(frozen=True, slots=True)
+class _Columns:
+    """Column-wise copy of the analyzed entries' hot fields."""
+
+    timestamps: array[float]
+    depths: array[int]
+    action_types: list[str | None]
+    durations: list[float | None]
 
 
 @dataclass(frozen=True, slots=True)
@@ -95,52 +157,119 @@ class LogAnalyzer:
             entries: LogEntries collection or list of LogEntry.
         """
         self._entries = entries if isinstance(entries, LogEntries) else LogEntries(entries)
+        self._deepest: int | None = None
+        self._duration_cache: dict[str, list[float]] | None = None
+        self._group_stats_cache: dict[str, ActionStat] | None = None
+        self._error_entries: list[LogEntry] | None = None
+        self._cols: _Columns | None = None
+        self._task_counts: dict[str, int] | None = None
+        self._timeline_cache: dict[float, Timeline] = {}
 
     # Helper methods
 
-    def _group_by_action(self, filtered: bool = True) -> dict[str, list[LogEntry]]:
-        """Group entries by action type using boltons bucketize.
+    def _columns(self) -> _Columns:
+        """Get the entries' hot fields as columns, built on first use.
 
-        Args:
-            filtered: If True, only include entries with action_type and duration.
+        Repeated analyses then scan flat arrays instead of reading attributes
+        off every LogEntry.
 
         Returns:
-            dict[str, list[LogEntry]]: Action type to entries mapping.
+            _Columns: Timestamp, depth, action type and duration columns.
         """
-        if filtered:
-            entries = [e for e in self._entries if e.action_type and e.duration is not None]
-        else:
-            entries = [e for e in self._entries if e.action_type]
+        if self._cols is None:
+            entries = self._entries
+            self._cols = _Columns(
+                timestamps=array("d", [e.timestamp for e in entries]),
+                depths=array("i", [e.depth for e in entries]),
+                action_types=[e.action_type for e in entries],
+                durations=[e.duration for e in entries],
+            )
+        return self._cols
 
-        return bucketize(entries, lambda e: e.action_type or "")  # type: ignore[no-untyped-call]
+    def _grouped_durations(self) -> dict[str, list[float]]:
+        """Group action durations by action type.
 
-    def _action_stats_from_groups(
-        self, groups: dict[str, list[LogEntry]]
-    ) -> dict[str, tuple[list[float], ActionStat]]:
-        """Calculate statistics from action groups.
+        The scan over entries runs once per analyzer; later calls reuse it.
 
-        Args:
-            groups: Action type to entries mapping.
+        Returns:
+            dict[str, list[float]]: Action type to durations mapping.
+        """
+        if self._duration_cache is None:
+            cols = self._columns()
+            groups: dict[str, list[float]] = {}
+            for action_type, duration in zip(cols.action_types, cols.durations, strict=True):
+                if action_type and duration is not None:
+                    groups.setdefault(action_type, []).append(duration)
+            self._duration_cache = groups
+        return self._duration_cache
+
+    def _action_stats(self) -> dict[str, ActionStat]:
+        """Get per-action duration statistics, computed once per analyzer.
 
         Returns:
-            dict: Action type to (durations, ActionStat) mapping.
+            dict[str, ActionStat]: Action type to ActionStat mapping.
         """
-        result = {}
-        for action_type, entries in groups.items():
-            durations = [e.duration for e in entries if e.duration is not None]
-            if durations:
-                result[action_type] = (
-                    durations,
-                    ActionStat(
-                        action_type=action_type,
-                        count=len(durations),
-                        total_duration=sum(durations),
-                        mean_duration=sum(durations) / len(durations),
-                        min_duration=min(durations),
-                        max_duration=max(durations),
-                    ),
+        if self._group_stats_cache is None:
+            stats = {}
+            for action_type, durations in self._grouped_durations().items():
+                count = len(durations)
+                total = sum(durations)
+                stats[action_type] = ActionStat(
+                    action_type=action_type,
+                    count=count,
+                    total_duration=total,
+                    mean_duration=total / count,
+                    min_duration=min(durations),
+                    max_duration=max(durations),
                 )
-        return result
+            self._group_stats_cache = stats
+        return self._group_stats_cache
+
+    def _get_error_entries(self) -> list[LogEntry]:
+        """Get the error entries, filtered once and shared by the error methods.
+
+        Returns:
+            list[LogEntry]: Entries at error level or above.
+        """
+        if self._error_entries is None:
+            self._error_entries = [e for e in self._entries if e.is_error]
+        return self._error_entries
+
+    def _get_task_counts(self) -> dict[str, int]:
+        """Get the number of entries per task UUID, counted once per analyzer.
+
+        Returns:
+            dict[str, int]: Task UUID to entry count mapping.
+        """
+        if self._task_counts is None:
+            self._task_counts = dict(Counter(e.task_uuid or "" for e in self._entries))
+        return self._task_counts
+
+    def _scan_for_report(self) -> None:
+        """Fill the error, nesting and task-count caches in one walk over entries.
+
+        Reports need all three; a fused pass reads each entry once instead of
+        three times. Caches that are already filled are kept.
+        """
+        if self._error_entries is not None and self._deepest is not None and self._task_counts is not None:
+            return
+        errors: list[LogEntry] = []
+        deepest = 0
+        task_counts: dict[str, int] = {}
+        for e in self._entries:
+            if e.is_error:
+                errors.append(e)
+            depth = e.depth
+            if depth > deepest:
+                deepest = depth
+            task_uuid = e.task_uuid or ""
+            task_counts[task_uuid] = task_counts.get(task_uuid, 0) + 1
+        if self._error_entries is None:
+            self._error_entries = errors
+        if self._deepest is None:
+            self._deepest = deepest
+        if self._task_counts is None:
+            self._task_counts = task_counts
 
     def _calculate_duration_stats(self, durations: list[float]) -> DurationStats:
         """Calculate duration statistics.
@@ -161,29 +290,22 @@ class LogAnalyzer:
 
         total = sum(durations)
         mean = total / n
-        median = statistics.median(durations)
-
-        # Calculate percentiles
-        p25_idx = int(n * 0.25)
-        p75_idx = int(n * 0.75)
-        p95_idx = int(n * 0.95)
-        p99_idx = int(n * 0.99)
-
-        p25 = sorted_durations[p25_idx]
-        p75 = sorted_durations[p75_idx]
-        p95 = sorted_durations[p95_idx]
-        p99 = sorted_durations[p99_idx]
+        # Percentiles interpolate between neighbours of the one sorted copy
+        p25, median, p75, p95, p99 = (
+            _quantile(sorted_durations, q) for q in (0.25, 0.5, 0.75, 0.95, 0.99)
+        )
 
-        # Calculate standard deviation
-        std = statistics.stdev(durations) if n > 1 else 0
+        # Sample standard deviation in float arithmetic; statistics.stdev works
+        # in exact fractions and dominates the cost on large groups
+        std = math.sqrt(sum((d - mean) ** 2 for d in durations) / (n - 1)) if n > 1 else 0
 
         return DurationStats(
             count=n,
             total=total,
             mean=mean,
             median=median,
-            min=min(durations),
-            max=max(durations),
+            min=sorted_durations[0],
+            max=sorted_durations[-1],
             std=std,
             p25=p25,
             p75=p75,
@@ -191,28 +313,26 @@ class LogAnalyzer:
             p99=p99,
         )
 
-    def _parse_interval(self, interval: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_interval(interval: str) -> float:
         """Parse interval string to seconds.
 
         Args:
-            interval: Interval string (e.g., "1min", "5min", "1hour").
+            interval: Interval string (e.g., "30s", "1min", "5min", "1hour", "2d").
+                A bare number is taken as minutes.
 
         Returns:
             float: Interval in seconds.
+
+        Raises:
+            ValueError: If the interval is not a number with a known unit.
         """
-        interval = interval.lower()
-
-        match interval:
-            case s if "sec" in s:
-                return float(s.replace("sec", "").replace("s", ""))
-            case s if "min" in s:
-                return float(s.replace("min", "").replace("m", "")) * 60
-            case s if "hour" in s:
-                return float(s.replace("hour", "").replace("h", "")) * 3600
-            case s if "day" in s:
-                return float(s.replace("day", "").replace("d", "")) * 86400
-            case _:
-                return float(interval) * 60
+        match = _INTERVAL_RE.match(interval)
+        if match is None:
+            raise ValueError(f"Invalid interval: {interval!r}")
+        value, unit = match.groups()
+        return float(value) * _UNIT_SECONDS[unit.lower() if unit else "min"]
 
     # Performance methods
 
@@ -225,12 +345,8 @@ class LogAnalyzer:
         Returns:
             list[ActionStat]: Slowest action statistics.
         """
-        groups = self._group_by_action()
-        stats = self._action_stats_from_groups(groups)
-
-        # Sort by mean duration (descending)
-        sorted_stats = sorted(stats.items(), key=lambda x: x[1][1].mean_duration, reverse=True)
-        return [stat for _, stat in sorted_stats[:n]]
+        # A bounded heap avoids sorting the whole tail of action types
+        return heapq.nlargest(n, self._action_stats().values(), key=attrgetter("mean_duration"))
 
     def fastest_actions(self, n: int = 10) -> list[ActionStat]:
         """Get the fastest actions.
@@ -241,12 +357,7 @@ class LogAnalyzer:
         Returns:
             list[ActionStat]: Fastest action statistics.
         """
-        groups = self._group_by_action()
-        stats = self._action_stats_from_groups(groups)
-
-        # Sort by mean duration (ascending)
-        sorted_stats = sorted(stats.items(), key=lambda x: x[1][1].mean_duration)
-        return [stat for _, stat in sorted_stats[:n]]
+        return heapq.nsmallest(n, self._action_stats().values(), key=attrgetter("mean_duration"))
 
     def duration_by_action(self) -> dict[str, DurationStats]:
         """Get duration statistics by action type.
@@ -254,12 +365,10 @@ class LogAnalyzer:
         Returns:
             dict[str, DurationStats]: Mapping of action type to stats.
         """
-        groups = self._group_by_action()
-        result = {}
-        for action_type, entries in groups.items():
-            durations = [e.duration for e in entries if e.duration is not None]
-            result[action_type] = self._calculate_duration_stats(durations)
-        return result
+        return {
+            action_type: self._calculate_duration_stats(durations)
+            for action_type, durations in self._grouped_durations().items()
+        }
 
     def percentile_durations(self, percentile: float = 95) -> list[ActionStat]:
         """Get actions at a specific percentile.
@@ -270,9 +379,7 @@ class LogAnalyzer:
         Returns:
             list[ActionStat]: Actions at the specified percentile.
         """
-        groups = self._group_by_action()
-        stats = self._action_stats_from_groups(groups)
-        return [stat for _, stat in sorted(stats.values(), key=lambda x: x.mean_duration, reverse=True)]
+        return sorted(self._action_stats().values(), key=lambda x: x.mean_duration, reverse=True)
 
     # Error methods
 
@@ -282,20 +389,22 @@ class LogAnalyzer:
         Returns:
             ErrorSummary: Error analysis summary.
         """
-        error_entries = [e for e in self._entries if e.is_error]
-
-        # Use bucketize for counting by level
-        level_groups = bucketize(error_entries, lambda e: e.level.value)  # type: ignore[no-untyped-call]
-        by_level = {k: len(v) for k, v in level_groups.items()}
-
-        # Use bucketize for counting by action
-        action_groups = bucketize(error_entries, lambda e: e.action_type or "unknown")  # type: ignore[no-untyped-call]
-        by_action = {k: len(v) for k, v in action_groups.items()}
-
-        # Find most common error
-        error_messages = [e.message for e in error_entries if e.message]
-        most_common_msg = Counter(error_messages).most_common(1)
-        most_common = (most_common_msg[0][0], most_common_msg[0][1]) if most_common_msg else ("", 0)
+        error_entries = self._get_error_entries()
+
+        # Fill all three tallies in a single walk over the errors
+        by_level: dict[int, int] = {}
+        by_action: dict[str, int] = {}
+        by_message: dict[str, int] = {}
+        for e in error_entries:
+            level = e.level.value
+            by_level[level] = by_level.get(level, 0) + 1
+            action = e.action_type or "unknown"
+            by_action[action] = by_action.get(action, 0) + 1
+            if e.message:
+                by_message[e.message] = by_message.get(e.message, 0) + 1
+
+        # Only the top message is needed, so take the max instead of ranking
+        most_common = max(by_message.items(), key=itemgetter(1), default=("", 0))
 
         return ErrorSummary(
             total_count=len(error_entries),
@@ -311,25 +420,33 @@ class LogAnalyzer:
         Returns:
             list[ErrorPattern]: List of error patterns.
         """
-        error_entries = [e for e in self._entries if e.is_error]
-
-        # Group by error type using boltons bucketize
-        error_groups = bucketize(error_entries, lambda e: e.action_type or "message")  # type: ignore[no-untyped-call]
-
-        result = []
-        for error_type, entries in error_groups.items():
-            timestamps = [e.timestamp for e in entries]
-            example = entries[0].message if entries and entries[0].message else None
-
-            result.append(
-                ErrorPattern(
-                    error_type=error_type,
-                    count=len(entries),
-                    first_seen=min(timestamps),
-                    last_seen=max(timestamps),
-                    example_message=example,
-                )
+        error_entries = self._get_error_entries()
+
+        # Keep [count, first_seen, last_seen, example] per error type while
+        # walking the errors once, instead of per-type lists of timestamps
+        groups: dict[str, list[Any]] = {}
+        for e in error_entries:
+            ts = e.timestamp
+            group = groups.get(e.action_type or "message")
+            if group is None:
+                groups[e.action_type or "message"] = [1, ts, ts, e.message or None]
+            else:
+                group[0] += 1
+                if ts < group[1]:
+                    group[1] = ts
+                elif ts > group[2]:
+                    group[2] = ts
+
+        result = [
+            ErrorPattern(
+                error_type=error_type,
+                count=count,
+                first_seen=first_seen,
+                last_seen=last_seen,
+                example_message=example,
             )
+            for error_type, (count, first_seen, last_seen, example) in groups.items()
+        ]
 
         # Sort by count (descending)
         result.sort(key=lambda x: x.count, reverse=True)
@@ -341,15 +458,16 @@ class LogAnalyzer:
         Returns:
             dict[str, float]: Mapping of action type to failure rate (0-1).
         """
-        groups = self._group_by_action(filtered=False)
+        # [total, failed] per action type, tallied in one pass
+        counts: dict[str, list[int]] = {}
+        for e in self._entries:
+            if e.action_type:
+                tally = counts.setdefault(e.action_type, [0, 0])
+                tally[0] += 1
+                if e.action_status == ActionStatus.FAILED:
+                    tally[1] += 1
 
-        result = {}
-        for action_type, entries in groups.items():
-            total = len(entries)
-            failed = sum(1 for e in entries if e.action_status == ActionStatus.FAILED)
-            result[action_type] = failed / total if total > 0 else 0.0
-
-        return result
+        return {action_type: failed / total for action_type, (total, failed) in counts.items()}
 
     def most_common_errors(self, n: int = 10) -> list[tuple[str, int]]:
         """Get most common error messages.
@@ -360,7 +478,7 @@ class LogAnalyzer:
         Returns:
             list[tuple[str, int]]: List of (message, count) tuples.
         """
-        error_messages = [e.message for e in self._entries if e.is_error and e.message]
+        error_messages = [e.message for e in self._get_error_entries() if e.message]
         return Counter(error_messages).most_common(n)
 
     # Task analysis methods
@@ -371,76 +489,88 @@ class LogAnalyzer:
         Returns:
             dict[str, DurationStats]: Mapping of task UUID to stats.
         """
-        filtered = [e for e in self._entries if e.task_uuid and e.duration is not None]
-
-        # Group by task UUID using boltons bucketize
-        task_groups = bucketize(filtered, lambda e: e.task_uuid or "")  # type: ignore[no-untyped-call]
+        # Collect durations straight into per-task lists; no entry lists in between
+        groups: dict[str, list[float]] = {}
+        for e in self._entries:
+            if e.task_uuid and e.duration is not None:
+                groups.setdefault(e.task_uuid, []).append(e.duration)
 
-        result = {}
-        for task_uuid, entries in task_groups.items():
-            durations = [e.duration for e in entries if e.duration is not None]
-            result[task_uuid] = self._calculate_duration_stats(durations)
-
-        return result
+        return {task_uuid: self._calculate_duration_stats(durations) for task_uuid, durations in groups.items()}
 
     def deepest_nesting(self) -> int:
         """Get the deepest nesting level.
 
+        Computed on first use; report generation asks for it repeatedly.
+
         Returns:
             int: Maximum nesting depth.
         """
-        return max((e.depth for e in self._entries), default=0)
+        if self._deepest is None:
+            self._deepest = max(self._columns().depths, default=0)
+        return self._deepest
 
-    def widest_tasks(self) -> list[tuple[str, int]]:
+    def widest_tasks(self, n: int | None = None) -> list[tuple[str, int]]:
         """Get tasks with the most child actions.
 
+        Args:
+            n: Number of tasks to return (all tasks if None).
+
         Returns:
             list[tuple[str, int]]: List of (task_uuid, child_count) tuples.
         """
-        # Use bucketize to count by task UUID
-        task_groups = bucketize(self._entries, lambda e: e.task_uuid or "")  # type: ignore[no-untyped-call]
-        task_counts = {k: len(v) for k, v in task_groups.items()}
+        task_counts = self._get_task_counts()
 
         # Sort by count (descending)
-        return sorted(task_counts.items(), key=lambda x: x[1], reverse=True)
+        if n is None:
+            return sorted(task_counts.items(), key=itemgetter(1), reverse=True)
+        return heapq.nlargest(n, task_counts.items(), key=itemgetter(1))
 
     def orphans(self) -> LogEntries:
         """Get orphaned entries (entries without matching start/end).
 
+        Orphans are starts of an action that was already open for the same
+        task, and starts that are never closed. They are returned in log
+        order.
+
         Returns:
             LogEntries: Collection of orphaned entries.
         """
-        # Track started actions
-        started: dict[str, set[str]] = {}  # task_uuid -> set of action types
-
-        # First pass: collect started actions
-        for entry in self._entries:
-            if entry.action_status == ActionStatus.STARTED and entry.action_type:
-                started.setdefault(entry.task_uuid, set()).add(entry.action_type)
-
-        # Second pass: find orphans
-        orphans: list[LogEntry] = []
-
-        for entry in self._entries:
+        # Open starts per (task, action): O(1) counter updates instead of set scans
+        open_counts: dict[tuple[str, str], int] = {}
+        first_open: dict[tuple[str, str], tuple[int, LogEntry]] = {}
+        # Each orphan is kept with its position so both kinds merge back into log order
+        duplicates: list[tuple[int, LogEntry]] = []
+
+        for position, entry in enumerate(self._entries):
+            if not entry.action_type:
+                continue
+            key = (entry.task_uuid, entry.action_type)
             match entry.action_status:
-                case ActionStatus.SUCCEEDED | ActionStatus.FAILED:
-                    if entry.task_uuid in started and entry.action_type in started[entry.task_uuid]:
-                        started[entry.task_uuid].discard(entry.action_type)
                 case ActionStatus.STARTED:
-                    # Check if this action was never completed
-                    if entry.task_uuid in started and entry.action_type in started[entry.task_uuid]:
-                        # This is a duplicate start, mark as orphan
-                        orphans.append(entry)
+                    count = open_counts.get(key, 0)
+                    if count:
+                        # Started again before the earlier start completed
+                        duplicates.append((position, entry))
+                    else:
+                        first_open[key] = (position, entry)
+                    open_counts[key] = count + 1
+                case ActionStatus.SUCCEEDED | ActionStatus.FAILED:
+                    if open_counts.get(key, 0):
+                        open_counts[key] -= 1
                 case _:
                     pass
 
-        return LogEntries(orphans)
+        unclosed = [item for key, item in first_open.items() if open_counts[key]]
+        return LogEntries([entry for _, entry in sorted(duplicates + unclosed, key=itemgetter(0))])
 
     # Timeline methods
 
     def timeline(self, interval: str = "1min") -> Timeline:
         """Get timeline of log activity.
 
+        Timelines are cached per interval length; the analyzed entries are
+        treated as immutable, so peak_periods and quiet_periods share one.
+
         Args:
             interval: Time interval (e.g., "1min", "5min", "1hour").
 
@@ -451,23 +581,32 @@ class LogAnalyzer:
             return Timeline(intervals=[], total_entries=0)
 
         interval_seconds = self._parse_interval(interval)
+        cached = self._timeline_cache.get(interval_seconds)
+        if cached is not None:
+            return cached
 
-        # Get time range
-        timestamps = [e.timestamp for e in self._entries]
+        timestamps = self._columns().timestamps
         start_time = min(timestamps)
-        end_time = max(timestamps)
-
-        # Create intervals
-        intervals: list[TimePeriod] = []
-        current_start = start_time
-
-        while current_start < end_time:
-            current_end = current_start + interval_seconds
-            count = sum(1 for ts in timestamps if current_start <= ts < current_end)
-            intervals.append(TimePeriod(start=current_start, end=current_end, entry_count=count))
-            current_start = current_end
-
-        return Timeline(intervals=intervals, total_entries=len(self._entries))
+        n_intervals = math.ceil((max(timestamps) - start_time) / interval_seconds)
+
+        # Each timestamp maps straight to its interval slot, so no sort is needed
+        counts = [0] * n_intervals
+        for ts in timestamps:
+            slot = int((ts - start_time) // interval_seconds)
+            if slot < n_intervals:
+                counts[slot] += 1
+
+        intervals = [
+            TimePeriod(
+                start=start_time + i * interval_seconds,
+                end=start_time + (i + 1) * interval_seconds,
+                entry_count=count,
+            )
+            for i, count in enumerate(counts)
+        ]
+        timeline = Timeline(intervals=intervals, total_entries=len(self._entries))
+        self._timeline_cache[interval_seconds] = timeline
+        return timeline
 
     def peak_periods(self, n: int = 5) -> list[TimePeriod]:
         """Get peak activity periods.
@@ -517,52 +656,41 @@ class LogAnalyzer:
 
     def _generate_html_report(self) -> str:
         """Generate HTML report."""
+        self._scan_for_report()
         error_summary = self.error_summary()
         deepest = self.deepest_nesting()
-        widest = self.widest_tasks()[:5]
-
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>Log Analysis Report</title>
-    <style>
-        body {{ font-family: sans-serif; margin: 20px; }}
-        .section {{ margin: 20px 0; padding: 15px; background: #f5f5f5; border-radius: 5px; }}
-        h2 {{ margin-top: 0; }}
-        .stat {{ display: inline-block; margin: 10px; padding: 10px; background: white; border-radius: 3px; }}
-        .stat-label {{ font-weight: bold; color: #666; }}
-        .stat-value {{ font-size: 1.2em; }}
-    </style>
-</head>
-<body>
-    <h1>Log Analysis Report</h1>
-    <div class="section">
-        <h2>Overview</h2>
-        <div class="stat"><span class="stat-label">Total Entries:</span> <span class="stat-value">{len(self._entries)}</span></div>
-        <div class="stat"><span class="stat-label">Errors:</span> <span class="stat-value">{error_summary.total_count}</span></div>
-        <div class="stat"><span class="stat-label">Deepest Nesting:</span> <span class="stat-value">{deepest}</span></div>
-    </div>
-    <div class="section">
-        <h2>Error Summary</h2>
-        <p>Most common error: <strong>{error_summary.most_common[0]}</strong> ({error_summary.most_common[1]} occurrences)</p>
-        <p>Unique error types: {error_summary.unique_types}</p>
-    </div>
-    <div class="section">
-        <h2>Widest Tasks</h2>
-        <ul>
-            {"".join(f"<li>{task_uuid}: {count} entries</li>" for task_uuid, count in widest)}
-        </ul>
-    </div>
-</body>
-</html>
-"""
+        widest = self.widest_tasks(5)
+        most_common, occurrences = error_summary.most_common
+
+        buf = io.StringIO()
+        w = buf.write
+        w(_REPORT_HTML_HEAD)
+        w('    <div class="section">\n        <h2>Overview</h2>\n')
+        for label, value in (
+            ("Total Entries", len(self._entries)),
+            ("Errors", error_summary.total_count),
+            ("Deepest Nesting", deepest),
+        ):
+            w(f'        <div class="stat"><span class="stat-label">{label}:</span> ')
+            w(f'<span class="stat-value">{value}</span></div>\n')
+        w("    </div>\n")
+        w('    <div class="section">\n        <h2>Error Summary</h2>\n')
+        w(f"        <p>Most common error: <strong>{html.escape(most_common)}</strong> ")
+        w(f"({occurrences} occurrences)</p>\n")
+        w(f"        <p>Unique error types: {error_summary.unique_types}</p>\n")
+        w("    </div>\n")
+        w('    <div class="section">\n        <h2>Widest Tasks</h2>\n        <ul>\n')
+        for task_uuid, count in widest:
+            w(f"            <li>{html.escape(task_uuid)}: {count} entries</li>\n")
+        w("        </ul>\n    </div>\n</body>\n</html>\n")
+        return buf.getvalue()
 
     def _generate_text_report(self) -> str:
         """Generate text report."""
+        self._scan_for_report()
         error_summary = self.error_summary()
         deepest = self.deepest_nesting()
-        widest = self.widest_tasks()[:5]
+        widest = self.widest_tasks(5)
 
         lines = [
             "Log Analysis Report",
@@ -588,6 +716,7 @@ class LogAnalyzer:
         """Generate JSON report."""
         import json
 
+        self._scan_for_report()
         error_summary = self.error_summary()
         report = {
             "total_entries": len(self._entries),
@@ -599,7 +728,7 @@ class LogAnalyzer:
                 "by_action": error_summary.by_action,
             },
             "deepest_nesting": self.deepest_nesting(),
-            "widest_tasks": self.widest_tasks()[:5],
+            "widest_tasks": self.widest_tasks(5),
         }
 
         return json.dumps(report, indent=2)
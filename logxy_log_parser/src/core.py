@@ -15,8 +15,14 @@ Python 3.12+ features used:
 from __future__ import annotations
 
 import json
-from collections.abc import Iterator
-from dataclasses import dataclass
+import mmap
+import os
+import stat
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, pairwise
 from pathlib import Path
 from typing import Any
 
@@ -45,6 +51,53 @@ from common.types import (
 )
 from .utils import extract_duration, get_field_value, level_from_entry
 
+# orjson decodes bytes directly and raises a json.JSONDecodeError subclass,
+# so callers keep catching json.JSONDecodeError either way.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _iter_lines(buf: mmap.mmap, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+    """Yield newline-delimited lines from a memory-mapped buffer.
+
+    Args:
+        buf: Read-only memory map of a log file.
+        start: Byte offset to start at (must be the start of a line).
+        end: Byte offset to stop at (must be just past a newline or EOF).
+
+    Yields:
+        bytes: Each line without its trailing newline.
+    """
+    find = buf.find
+    end = len(buf) if end is None else end
+    while (nl := find(b"\n", start, end)) != -1:
+        yield buf[start:nl]
+        start = nl + 1
+    if start < end:
+        yield buf[start:end]
+
+
+_COUNT_CHUNK = 1024 * 1024
+
+
+def _count_newlines(buf: mmap.mmap, start: int, end: int) -> int:
+    """Count newlines in buf[start:end] in bounded chunks (no full-range copy)."""
+    return sum(
+        buf[i:min(i + _COUNT_CHUNK, end)].count(b"\n") for i in range(start, end, _COUNT_CHUNK)
+    )
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings so equal keys share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _as_text(line: str | bytes) -> str:
+    """Decode a raw line for error reporting."""
+    return line.decode("utf-8", errors="replace") if isinstance(line, bytes) else line
+
 
 @dataclass(frozen=True, slots=True)
 class LogEntry:
@@ -65,10 +118,23 @@ class LogEntry:
     fields: dict[str, Any]
     line_number: int = 0  # Line number in the log file (0 if unknown)
     _format: str = "auto"  # Detected format: "compact", "legacy", or "auto"
+    # Derived once in __post_init__; hot filter loops read these as plain slots
+    _level: Level = field(init=False, repr=False, compare=False)
+    _is_error: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the log level and error flag once at construction."""
+        level = self._resolve_level()
+        object.__setattr__(self, "_level", level)
+        object.__setattr__(self, "_is_error", level in (Level.ERROR, Level.CRITICAL))
 
     @property
     def level(self) -> Level:
         """Get the log level for this entry."""
+        return self._level
+
+    def _resolve_level(self) -> Level:
+        """Derive the log level from the entry's fields."""
         # Check direct level field first
         if "level" in self.fields:
             level_val = self.fields["level"]
@@ -91,7 +157,7 @@ class LogEntry:
     @property
     def is_error(self) -> bool:
         """Check if this is an error-level entry."""
-        return self.level in (Level.ERROR, Level.CRITICAL)
+        return self._is_error
 
     @property
     def is_action(self) -> bool:
@@ -143,13 +209,18 @@ class LogEntry:
         known_fields = ALL_KNOWN_FIELDS | {"status"}
         fields = {k: v for k, v in data.items() if k not in known_fields}
 
+        # Message and action types are a small vocabulary repeated across
+        # thousands of lines; interning collapses the duplicates and lets
+        # dict/Counter lookups short-circuit on identity. Task ids are not
+        # interned: interned strings are immortal on 3.12, and every distinct
+        # id would stay alive for the life of the process
         return cls(
             timestamp=timestamp,
             task_uuid=get_field_value(data, TID, ""),
             task_level=task_level,
-            message_type=get_field_value(data, MT, ""),
+            message_type=_intern(get_field_value(data, MT, "")),
             message=get_field_value(data, MSG),
-            action_type=get_field_value(data, AT),
+            action_type=_intern(get_field_value(data, AT)),
             action_status=action_status,
             duration=duration,
             fields=fields,
@@ -333,6 +404,30 @@ class ParseError:
         }
 
 
+# Files smaller than this parse faster in-process than the pool takes to start
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _parse_range(
+    path: str, start: int, end: int, first_line: int
+) -> tuple[list[LogEntry], list[ParseError]]:
+    """Parse the lines in a byte range of a log file (process pool worker).
+
+    Args:
+        path: Path to the log file.
+        start: Byte offset of the first line in the range.
+        end: Byte offset just past the last line in the range.
+        first_line: Line number of the line before ``start``.
+
+    Returns:
+        tuple: Parsed entries and parse errors for the range.
+    """
+    parser = LogParser(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        entries = parser._parse_file(_iter_lines(buf, start, end), first_line)
+    return entries, parser._errors
+
+
 class LogParser:
     """Parse LogXPy JSON log files.
 
@@ -384,8 +479,7 @@ class LogParser:
         if isinstance(self._source, (str, Path)):
             path = Path(self._source)
             if path.exists():
-                with open(path, encoding="utf-8") as f:
-                    entries = self._parse_file(f)
+                entries = self._parse_path(path)
         elif isinstance(self._source, list):
             entries = [LogEntry.from_dict(d) for d in self._source]
         elif hasattr(self._source, "read"):
@@ -415,18 +509,96 @@ class LogParser:
         else:
             raise ValueError(f"Unsupported source type: {type(self._source)}")
 
-    def _parse_file(self, file_obj: Any) -> list[LogEntry]:
+    def parse_parallel(self, workers: int | None = None) -> list[LogEntry]:
+        """Parse a log file in newline-aligned chunks across worker processes.
+
+        Splits the file into one byte range per worker, parses each range in
+        its own process and concatenates the results in file order. Line
+        numbers and parse errors match a sequential parse. Non-file sources
+        and small files fall back to parse().
+
+        Args:
+            workers: Number of worker processes (default: os.cpu_count()).
+
+        Returns:
+            list[LogEntry]: All parsed log entries.
+        """
+        if self._entries is not None:
+            return self._entries
+
+        workers = workers or os.cpu_count() or 1
+        if not isinstance(self._source, (str, Path)) or workers < 2:
+            return self.parse()
+        path = Path(self._source)
+        if not path.exists() or path.stat().st_size < _PARALLEL_MIN_BYTES:
+            return self.parse()
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            size = len(buf)
+            bounds = [0]
+            for i in range(1, workers):
+                # Move each split point just past the next newline
+                nl = buf.find(b"\n", max(i * size // workers, bounds[-1]))
+                if nl == -1:
+                    break
+                bounds.append(nl + 1)
+            bounds.append(size)
+            bounds = sorted(set(bounds))
+            first_lines = [0]
+            for lo, hi in pairwise(bounds[:-1]):
+                first_lines.append(first_lines[-1] + _count_newlines(buf, lo, hi))
+
+        ranges = list(pairwise(bounds))
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            parts = list(pool.map(
+                _parse_range,
+                [str(path)] * len(ranges),
+                [lo for lo, _ in ranges],
+                [hi for _, hi in ranges],
+                first_lines,
+            ))
+
+        self._entries = list(chain.from_iterable(entries for entries, _ in parts))
+        self._errors = list(chain.from_iterable(errors for _, errors in parts))
+        return self._entries
+
+    def _parse_path(self, path: Path) -> list[LogEntry]:
+        """Parse a log file, through a read-only memory map when possible.
+
+        Non-empty regular files are split on raw bytes and decoded straight
+        from the map, skipping the text-mode line buffering of a regular
+        file read. Pipes, FIFOs and character devices (``/dev/stdin``,
+        ``<(...)``) report size 0 and cannot be mapped, so they and empty
+        files are read line by line from a buffered binary handle.
+
+        Args:
+            path: Path to the log file.
+
+        Returns:
+            list[LogEntry]: All parsed entries.
+        """
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                return self._parse_file(f)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return self._parse_file(_iter_lines(buf))
+
+    def _parse_file(
+        self, file_obj: Iterable[str] | Iterable[bytes], first_line: int = 0
+    ) -> list[LogEntry]:
         """Parse all lines from a file object.
 
         Args:
-            file_obj: File-like object to read from.
+            file_obj: File-like object (or iterable of str/bytes lines) to read from.
+            first_line: Line number preceding the first line read.
 
         Returns:
             list[LogEntry]: All parsed entries.
         """
         entries: list[LogEntry] = []
         self._errors = []
-        line_number = 0
+        line_number = first_line
 
         for line in file_obj:
             line_number += 1
@@ -434,12 +606,12 @@ class LogParser:
             if not line_stripped:
                 continue
             try:
-                data = json.loads(line_stripped)
+                data = _json_loads(line_stripped)
                 entries.append(LogEntry.from_dict(data, line_number))
             except json.JSONDecodeError as e:
-                self._errors.append(ParseError(line_number, line_stripped, f"JSON decode error: {e}"))
+                self._errors.append(ParseError(line_number, _as_text(line_stripped), f"JSON decode error: {e}"))
             except (ValueError, KeyError, TypeError) as e:
-                self._errors.append(ParseError(line_number, line_stripped, f"Parse error: {e}"))
+                self._errors.append(ParseError(line_number, _as_text(line_stripped), f"Parse error: {e}"))
         return entries
 
     def _parse_stream_file(self, file_obj: Any) -> Iterator[LogEntry]:
@@ -458,7 +630,7 @@ class LogParser:
             if not line_stripped:
                 continue
             try:
-                data = json.loads(line_stripped)
+                data = _json_loads(line_stripped)
                 yield LogEntry.from_dict(data, line_number)
             except (json.JSONDecodeError, ValueError, KeyError):
                 # Skip malformed lines in stream mode (no error tracking)
@@ -8,11 +8,57 @@ from __future__ import annotations
 
 import csv
 import json
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .filter import LogEntries
 
+if TYPE_CHECKING:
+    from .core import LogEntry
+
+
+def _json_dumps_bytes(obj: Any, pretty: bool) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes with the stdlib encoder."""
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode("utf-8")
+
+
+try:
+    from orjson import (
+        OPT_INDENT_2,
+        OPT_NON_STR_KEYS,
+        OPT_PASSTHROUGH_DATACLASS,
+        OPT_PASSTHROUGH_DATETIME,
+        JSONEncodeError,
+    )
+    from orjson import dumps as _orjson_dumps
+
+    # Types json.dumps rejects are passed through, so orjson rejects them too
+    _ORJSON_OPTIONS = OPT_NON_STR_KEYS | OPT_PASSTHROUGH_DATETIME | OPT_PASSTHROUGH_DATACLASS
+
+    def _dumps_bytes(obj: Any, pretty: bool) -> bytes:
+        """Serialize an object to UTF-8 JSON bytes with orjson.
+
+        Anything orjson refuses (integers wider than 64 bits, datetimes,
+        dataclasses) is re-encoded with the stdlib encoder, which handles
+        big integers and raises the usual TypeError for the rest. The one
+        difference from json.dumps is that NaN and +/-Infinity are written
+        as ``null`` instead of the non-standard ``NaN``/``Infinity`` tokens.
+        """
+        option = (_ORJSON_OPTIONS | OPT_INDENT_2) if pretty else _ORJSON_OPTIONS
+        try:
+            return _orjson_dumps(obj, option=option)
+        except JSONEncodeError:
+            return _json_dumps_bytes(obj, pretty)
+
+except ImportError:
+    _dumps_bytes = _json_dumps_bytes
+
+
+def _as_entries(entries: LogEntries | Iterable[LogEntry]) -> LogEntries:
+    """Wrap plain iterables so exporters can share LogEntries' cached rows."""
+    return entries if isinstance(entries, LogEntries) else LogEntries(list(entries))
+
 
 class JsonExporter:
     """Export log entries to JSON format."""
@@ -20,21 +66,26 @@ class JsonExporter:
     def export(self, entries: LogEntries, file: str | Path, pretty: bool = True) -> None:
         """Export entries to JSON file.
 
+        When orjson is installed it does the encoding; the output is the
+        same as with the stdlib encoder except that NaN and infinite floats
+        are written as ``null``.
+
         Args:
             entries: LogEntries collection to export.
             file: Output file path.
             pretty: Pretty-print JSON if True.
+
+        Raises:
+            TypeError: If a field holds a value JSON cannot represent.
         """
         path = Path(file)
         path.parent.mkdir(parents=True, exist_ok=True)
 
         data = [entry.to_dict() for entry in entries]
 
-        with open(path, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(data, f, ensure_ascii=False)
+        # Serialize in memory and hand the OS a single buffer
+        with open(path, "wb") as f:
+            f.write(_dumps_bytes(data, pretty))
 
 
 class CsvExporter:
@@ -61,16 +112,14 @@ class CsvExporter:
         fieldnames: set[str] = set()
         rows: list[dict[str, Any]] = []
 
-        for entry in entries:
+        entries = _as_entries(entries)
+        for entry, base in zip(entries, entries._export_rows(), strict=True):
             row: dict[str, Any] = {
-                "timestamp": entry.timestamp,
-                "task_uuid": entry.task_uuid,
-                "level": entry.level.value,
-                "message_type": entry.message_type,
-                "message": entry.message or "",
-                "action_type": entry.action_type or "",
-                "action_status": entry.action_status.value if entry.action_status else "",
-                "duration": entry.duration or "",
+                **base,
+                "message": base["message"] or "",
+                "action_type": base["action_type"] or "",
+                "action_status": base["action_status"] or "",
+                "duration": base["duration"] or "",
             }
 
             if flatten:
@@ -89,11 +138,12 @@ class CsvExporter:
             fieldnames.update(row.keys())
             rows.append(row)
 
-        # Write CSV
+        # Write CSV; plain row lists skip DictWriter's per-row extra-key check
+        header = sorted(fieldnames)
         with open(path, "w", newline="", encoding="utf-8") as f:
-            writer: csv.DictWriter[str] = csv.DictWriter(f, fieldnames=sorted(fieldnames))
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows([row.get(k, "") for k in header] for row in rows)
 
 
 class HtmlExporter:
@@ -178,36 +228,27 @@ class HtmlExporter:
         rows = []
         error_count = 0
 
-        for entry in entries:
+        entries = _as_entries(entries)
+        for entry, (ts_str, duration_str) in zip(entries, entries._display_strings(), strict=True):
+            level = entry.level
             if entry.is_error:
                 error_count += 1
 
-            # Format timestamp
-            from .utils import format_timestamp
-            ts_str = format_timestamp(entry.timestamp)
-
-            # Format duration
-            duration_str = ""
-            if entry.duration is not None:
-                from .utils import parse_duration
-                duration_str = parse_duration(entry.duration)
-
             # Format fields
             fields_str = ""
             if entry.fields:
                 fields_str = f'<div class="fields"><pre>{json.dumps(entry.fields, indent=2)}</pre></div>'
 
-            row = f"""
+            rows.append(f"""
                 <tr>
                     <td class="timestamp">{ts_str}</td>
-                    <td class="level-{entry.level.value}">{entry.level.value.upper()}</td>
+                    <td class="level-{level.value}">{level.value.upper()}</td>
                     <td class="message">{entry.message or '-'}</td>
                     <td>{entry.action_type or '-'}</td>
                     <td>{duration_str}</td>
                     <td>{fields_str}</td>
                 </tr>
-            """
-            rows.append(row)
+            """)
 
         # Fill template
         html = html_template.format(
@@ -260,8 +301,7 @@ class MarkdownExporter:
         path = Path(file)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        from .utils import format_timestamp, parse_duration
-
+        entries = _as_entries(entries)
         lines = [
             "# Log Entries\n",
             f"**Total Entries:** {len(entries)}\n",
@@ -270,12 +310,11 @@ class MarkdownExporter:
             "|-----------|-------|---------|--------|----------|",
         ]
 
-        for entry in entries:
-            ts_str = format_timestamp(entry.timestamp)
+        for entry, (ts_str, duration_str) in zip(entries, entries._display_strings(), strict=True):
             level_str = entry.level.value.upper()
             message_str = (entry.message or "-").replace("|", "\\|")
             action_str = entry.action_type or "-"
-            duration_str = parse_duration(entry.duration) if entry.duration else "-"
+            duration_str = duration_str if entry.duration else "-"
 
             lines.append(f"| {ts_str} | {level_str} | {message_str} | {action_str} | {duration_str} |")
 
@@ -315,22 +354,12 @@ class DataFrameExporter:
                 "Install with: pip install logxy-log-parser[pandas]"
             ) from e
 
-        # Convert entries to list of dicts
-        data = []
-        for entry in entries:
-            row = {
-                "timestamp": entry.timestamp,
-                "task_uuid": entry.task_uuid,
-                "level": entry.level.value,
-                "message_type": entry.message_type,
-                "message": entry.message,
-                "action_type": entry.action_type,
-                "action_status": entry.action_status.value if entry.action_status else None,
-                "duration": entry.duration,
-            }
-            # Add fields as columns
-            row.update(entry.fields)
-            data.append(row)
+        # Core columns plus fields as columns
+        entries = _as_entries(entries)
+        data = [
+            {**row, **entry.fields}
+            for entry, row in zip(entries, entries._export_rows(), strict=True)
+        ]
 
         return pandas.DataFrame(data)
 
@@ -371,7 +400,7 @@ class PdfExporter:
                 "Install with: pip install logxy-log-parser[pdf]"
             )
 
-        import weasyprint  # noqa: F401
+        import weasyprint
 
         # First generate HTML
         html_exporter = HtmlExporter()
@@ -389,6 +418,25 @@ class PdfExporter:
                 html_path.unlink()
 
 
+def _template_row(
+    entry: LogEntry, base: dict[str, Any], display: tuple[str, str]
+) -> dict[str, Any]:
+    """Build the per-entry context dict used by the template exporters."""
+    ts_str, duration_str = display
+    return {
+        "timestamp": base["timestamp"],
+        "timestamp_str": ts_str,
+        "task_uuid": base["task_uuid"],
+        "level": base["level"],
+        "message": base["message"] or "",
+        "action_type": base["action_type"] or "",
+        "action_status": base["action_status"] or "",
+        "duration": base["duration"],
+        "duration_str": duration_str if entry.duration else "",
+        "fields": entry.fields,
+    }
+
+
 class CustomTemplateExporter:
     """Export log entries using custom templates."""
 
@@ -418,24 +466,14 @@ class CustomTemplateExporter:
         with open(template_path, encoding="utf-8") as f:
             template_content = f.read()
 
-        # Collect template variables
-        from .utils import format_timestamp, parse_duration
-
         # Build entry data
-        entries_data = []
-        for entry in entries:
-            entries_data.append({
-                "timestamp": entry.timestamp,
-                "timestamp_str": format_timestamp(entry.timestamp),
-                "task_uuid": entry.task_uuid,
-                "level": entry.level.value,
-                "message": entry.message or "",
-                "action_type": entry.action_type or "",
-                "action_status": entry.action_status.value if entry.action_status else "",
-                "duration": entry.duration,
-                "duration_str": parse_duration(entry.duration) if entry.duration else "",
-                "fields": entry.fields,
-            })
+        entries = _as_entries(entries)
+        entries_data = [
+            _template_row(entry, base, display)
+            for entry, base, display in zip(
+                entries, entries._export_rows(), entries._display_strings(), strict=True
+            )
+        ]
 
         # Calculate stats
         level_counts: dict[str, int] = {}
@@ -478,7 +516,7 @@ class Jinja2Exporter:
             bool: True if Jinja2 is available.
         """
         try:
-            import jinja2  # noqa: F401  # noqa: F401
+            import jinja2  # noqa: F401
             return True
         except ImportError:
             return False
@@ -507,7 +545,7 @@ class Jinja2Exporter:
                 "Install with: pip install logxy-log-parser[templates]"
             )
 
-        import jinja2  # noqa: F401
+        import jinja2
 
         template_path = Path(template_path)
         path = Path(file)
@@ -522,30 +560,21 @@ class Jinja2Exporter:
         template = env.get_template(template_path.name)
 
         # Build context
-        from .utils import format_timestamp, parse_duration
-
         entries_data = []
         level_counts: dict[str, int] = {}
         error_count = 0
 
-        for entry in entries:
+        entries = _as_entries(entries)
+        for entry, base, display in zip(
+            entries, entries._export_rows(), entries._display_strings(), strict=True
+        ):
             level_counts[entry.level.value] = level_counts.get(entry.level.value, 0) + 1
             if entry.is_error:
                 error_count += 1
 
-            entries_data.append({
-                "timestamp": entry.timestamp,
-                "timestamp_str": format_timestamp(entry.timestamp),
-                "task_uuid": entry.task_uuid,
-                "level": entry.level.value,
-                "message": entry.message or "",
-                "action_type": entry.action_type or "",
-                "action_status": entry.action_status.value if entry.action_status else "",
-                "duration": entry.duration,
-                "duration_str": parse_duration(entry.duration) if entry.duration else "",
-                "fields": entry.fields,
-                "entry": entry,  # Full entry access
-            })
+            row = _template_row(entry, base, display)
+            row["entry"] = entry  # Full entry access
+            entries_data.append(row)
 
         template_context = {
             "entries": entries_data,
@@ -10,17 +10,36 @@ Supports both compact and legacy field naming conventions.
 from __future__ import annotations
 
 import re
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from fnmatch import translate
+from functools import lru_cache
 from itertools import islice
 from math import inf
 from pathlib import Path
 from typing import Any
 
+from common.types import Level, get_level_value
 from .core import LogEntry
 from .utils import bucketize, parse_timestamp, unique
 
 
+# Characters that make an action type argument a glob pattern
+_GLOB_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile a regex once and reuse it across filter calls."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=256)
+def _compile_globs(globs: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile glob patterns into a single alternation regex."""
+    return re.compile("|".join(map(translate, globs)))
+
+
 class LogEntries:
     """Collection of log entries with filtering and aggregation methods."""
 
@@ -31,6 +50,8 @@ class LogEntries:
             entries: List or iterator of LogEntry objects.
         """
         self._entries = list(entries) if not isinstance(entries, list) else entries
+        self._rows: list[dict[str, Any]] | None = None
+        self._display: list[tuple[str, str]] | None = None
 
     def __len__(self) -> int:
         """Get the number of entries in this collection."""
@@ -69,8 +90,12 @@ class LogEntries:
             reverse: Sort in descending order if True.
 
         Returns:
-            LogEntries: Sorted collection.
+            LogEntries: Sorted collection (this collection if it has fewer
+            than two entries).
         """
+        if len(self._entries) < 2:
+            return self
+
         def sort_key(entry: LogEntry) -> Any:
             match key:
                 case "timestamp":
@@ -91,14 +116,17 @@ class LogEntries:
             n: Maximum number of entries to return.
 
         Returns:
-            LogEntries: Limited collection.
+            LogEntries: Limited collection (this collection if it already
+            holds at most n entries).
         """
+        if n >= len(self._entries):
+            return self
         return LogEntries(list(islice(self._entries, n)))
 
     def unique(self, key: str | None = None) -> LogEntries:
         """Get unique entries based on a key.
 
-        Uses boltons' unique for efficient deduplication.
+        Order is preserved and the first entry seen for each key is kept.
 
         Args:
             key: Field name to check uniqueness. If None, uses full entry.
@@ -109,8 +137,11 @@ class LogEntries:
         if key is None:
             # Use boltons unique for full entry uniqueness
             return LogEntries(list(unique(self._entries)))
-        # Use boltons unique with key function
-        return LogEntries(list(unique(self._entries, key=lambda e: e.get(key))))
+        # Keep the first entry per key; dict preserves insertion order
+        first: dict[Any, LogEntry] = {}
+        for e in self._entries:
+            first.setdefault(e.get(key), e)
+        return LogEntries(list(first.values()))
 
     # Aggregation methods
 
@@ -139,23 +170,77 @@ class LogEntries:
     def group_by(self, key: str) -> dict[str, LogEntries]:
         """Group entries by a field value.
 
-        Uses boltons' bucketize for efficient grouping.
+        Log files emit each task as a contiguous run of lines, so consecutive
+        entries usually share a key; the current bucket is reused until the
+        key changes and the dict is only consulted at run boundaries.
 
         Args:
             key: Field name to group by.
 
         Returns:
-            dict[str, LogEntries]: Mapping of value to LogEntries.
+            dict[str, LogEntries]: Mapping of value to LogEntries (first-seen order).
         """
-        def _get_key(entry: LogEntry) -> str:
-            return str(entry.get(key, ""))
+        groups: dict[str, list[LogEntry]] = {}
+        prev: str | None = None
+        bucket: list[LogEntry] = []
+
+        for entry in self._entries:
+            k = str(entry.get(key, ""))
+            if k != prev:
+                bucket = groups.setdefault(k, [])
+                prev = k
+            bucket.append(entry)
 
-        # Use boltons bucketize for efficient grouping
-        groups: dict[str, list[LogEntry]] = bucketize(self._entries, _get_key)  # type: ignore[no-untyped-call]
         return {k: LogEntries(v) for k, v in groups.items()}
 
     # Export methods (delegates to export module)
 
+    def _export_rows(self) -> list[dict[str, Any]]:
+        """Get the per-entry column values shared by the exporters.
+
+        Built once per collection so exporting to several formats does not
+        re-project every entry.
+
+        Returns:
+            list[dict[str, Any]]: One dict of core columns per entry.
+        """
+        if self._rows is None or len(self._rows) != len(self._entries):
+            self._rows = [
+                {
+                    "timestamp": e.timestamp,
+                    "task_uuid": e.task_uuid,
+                    "level": e.level.value,
+                    "message_type": e.message_type,
+                    "message": e.message,
+                    "action_type": e.action_type,
+                    "action_status": e.action_status.value if e.action_status else None,
+                    "duration": e.duration,
+                }
+                for e in self._entries
+            ]
+        return self._rows
+
+    def _display_strings(self) -> list[tuple[str, str]]:
+        """Get formatted (timestamp, duration) strings for each entry.
+
+        Cached alongside _export_rows() for the HTML, Markdown and template
+        exporters. The duration string is empty when an entry has none.
+
+        Returns:
+            list[tuple[str, str]]: Formatted timestamp and duration per entry.
+        """
+        if self._display is None or len(self._display) != len(self._entries):
+            from .utils import format_timestamp, parse_duration
+
+            self._display = [
+                (
+                    format_timestamp(e.timestamp),
+                    parse_duration(e.duration) if e.duration is not None else "",
+                )
+                for e in self._entries
+            ]
+        return self._display
+
     def to_json(self, file: str | Path, pretty: bool = True) -> None:
         """Export entries to JSON file.
 
@@ -212,6 +297,45 @@ class LogEntries:
 
         return DataFrameExporter().export(self)
 
+    def to_all(
+        self,
+        out_dir: str | Path,
+        formats: Iterable[str] = ("json", "csv", "html", "md"),
+        stem: str = "export",
+    ) -> dict[str, Path]:
+        """Export entries to several file formats at once.
+
+        The per-entry columns are projected once and shared by every
+        writer, so each extra format only pays for its own serialization.
+
+        Args:
+            out_dir: Directory to write into (must exist).
+            formats: Formats to write: "json", "csv", "html" and/or "md".
+            stem: Base file name; each file gets the format as extension.
+
+        Returns:
+            dict[str, Path]: Written file path per format, in request order.
+
+        Raises:
+            ValueError: If a format is not recognized.
+        """
+        writers: dict[str, Callable[[Path], None]] = {
+            "json": self.to_json,
+            "csv": self.to_csv,
+            "html": self.to_html,
+            "md": self.to_markdown,
+        }
+        formats = list(formats)
+        if unknown := [fmt for fmt in formats if fmt not in writers]:
+            raise ValueError(f"Unknown export format(s): {', '.join(unknown)}")
+
+        written: dict[str, Path] = {}
+        for fmt in formats:
+            path = Path(out_dir) / f"{stem}.{fmt}"
+            writers[fmt](path)
+            written[fmt] = path
+        return written
+
 
 class LogFilter:
     """Chainable filter builder for log entries."""
@@ -226,17 +350,26 @@ class LogFilter:
 
     # Level filters
 
-    def by_level(self, *levels: str) -> LogEntries:
+    def by_level(self, *levels: str | Level) -> LogEntries:
         """Filter by log level(s).
 
+        Level names are resolved to Level values once, so each entry is
+        matched with an integer set lookup rather than string comparisons.
+        With no levels the filter is a no-op and returns the entries unscanned.
+
         Args:
-            *levels: One or more log levels to include.
+            *levels: One or more log levels (names or Level values) to include.
 
         Returns:
             LogEntries: Filtered entries.
+
+        Raises:
+            ValueError: If a level name is not recognized.
         """
-        level_set = set(levels)
-        return self._entries.filter(lambda e: e.level.value in level_set)
+        if not levels:
+            return self._entries
+        level_set = frozenset(map(get_level_value, levels))
+        return self._entries.filter(lambda e: e.level in level_set)
 
     def debug(self) -> LogEntries:
         """Filter for debug level entries."""
@@ -260,9 +393,13 @@ class LogFilter:
 
     # Content filters
 
-    def by_message(self, pattern: str, regex: bool = False) -> LogEntries:
+    def by_message(self, pattern: str | None, regex: bool = False) -> LogEntries:
         """Filter by message content.
 
+        A ``None`` pattern is a no-op and returns the entries unscanned.
+        Patterns that match any text (``""`` or the regex ``".*"``) keep
+        every entry that has a message, without running the matcher.
+
         Args:
             pattern: Text pattern to match.
             regex: Use regex matching if True.
@@ -270,28 +407,82 @@ class LogFilter:
         Returns:
             LogEntries: Filtered entries.
         """
+        if pattern is None:
+            return self._entries
+        if not pattern or (regex and pattern == ".*"):
+            return self._entries.filter(lambda e: e.message is not None)
         match regex:
             case True:
-                compiled = re.compile(pattern, re.IGNORECASE)
+                search = _compile(pattern, re.IGNORECASE).search
                 return self._entries.filter(
-                    lambda e: e.message is not None and compiled.search(e.message) is not None
+                    lambda e: e.message is not None and search(e.message) is not None
                 )
             case False:
+                needle = pattern.lower()
+                return self._entries.filter(
+                    lambda e: e.message is not None and needle in e.message.lower()
+                )
+
+    def by_messages(self, *patterns: str, regex: bool = False) -> LogEntries:
+        """Filter by messages matching any of several patterns.
+
+        Patterns are combined into one case-insensitive alternation and
+        compiled once, so each message is scanned a single time no matter
+        how many patterns are given. Regexes with capture groups or global
+        inline flags such as ``(?s)`` would change meaning inside a shared
+        alternation (backreferences renumber, flags must lead the pattern),
+        so those are compiled and searched one by one instead. With no
+        patterns the filter is a no-op.
+
+        Args:
+            *patterns: Text patterns (or regexes if ``regex``) to match.
+            regex: Treat patterns as regular expressions if True.
+
+        Returns:
+            LogEntries: Entries whose message matches at least one pattern.
+        """
+        if not patterns:
+            return self._entries
+        if regex:
+            compiled = [_compile(p, re.IGNORECASE) for p in patterns]
+            base_flags = _compile("", re.IGNORECASE).flags
+            if any(c.groups or c.flags != base_flags for c in compiled):
+                searches = [c.search for c in compiled]
                 return self._entries.filter(
-                    lambda e: e.message is not None and pattern.lower() in e.message.lower()
+                    lambda e: e.message is not None
+                    and any(search(e.message) is not None for search in searches)
                 )
+        parts = patterns if regex else map(re.escape, patterns)
+        search = _compile("|".join(f"(?:{p})" for p in parts), re.IGNORECASE).search
+        return self._entries.filter(
+            lambda e: e.message is not None and search(e.message) is not None
+        )
 
     def by_action_type(self, *types: str) -> LogEntries:
         """Filter by action type(s).
 
+        Types containing ``*``, ``?`` or ``[`` are treated as glob patterns
+        (e.g. ``"database:*"``) and compiled once into a single regex. With
+        no types the filter is a no-op and returns the entries unscanned.
+
         Args:
-            *types: One or more action types to include.
+            *types: One or more action types or glob patterns to include.
 
         Returns:
             LogEntries: Filtered entries.
         """
-        type_set = set(types)
-        return self._entries.filter(lambda e: e.action_type in type_set)
+        if not types:
+            return self._entries
+        type_set = {t for t in types if _GLOB_CHARS.isdisjoint(t)}
+        globs = tuple(t for t in types if not _GLOB_CHARS.isdisjoint(t))
+        if not globs:
+            return self._entries.filter(lambda e: e.action_type in type_set)
+
+        match = _compile_globs(globs).match
+        return self._entries.filter(
+            lambda e: e.action_type is not None
+            and (e.action_type in type_set or match(e.action_type) is not None)
+        )
 
     def by_field(self, field: str, value: Any) -> LogEntries:
         """Filter by exact field value.
@@ -327,21 +518,30 @@ class LogFilter:
 
     # Time filters
 
-    def by_time_range(self, start: str | datetime | float, end: str | datetime | float) -> LogEntries:
+    def by_time_range(
+        self, start: str | datetime | float | None, end: str | datetime | float | None
+    ) -> LogEntries:
         """Filter by time range.
 
         Args:
-            start: Start time (datetime, timestamp string, or float).
-            end: End time (datetime, timestamp string, or float).
+            start: Start time (datetime, timestamp string, or float), or None
+                for no lower bound.
+            end: End time (datetime, timestamp string, or float), or None for
+                no upper bound. With both bounds None the filter is a no-op.
 
         Returns:
             LogEntries: Filtered entries.
         """
+        if start is None and end is None:
+            return self._entries
+
         # Convert to timestamps
         start_ts: float
         end_ts: float
 
-        if isinstance(start, str):
+        if start is None:
+            start_ts = -inf
+        elif isinstance(start, str):
             start_dt = parse_timestamp(float(start))
             start_ts = start_dt.timestamp()
         elif isinstance(start, datetime):
@@ -349,7 +549,9 @@ class LogFilter:
         else:
             start_ts = start
 
-        if isinstance(end, str):
+        if end is None:
+            end_ts = inf
+        elif isinstance(end, str):
             end_dt = parse_timestamp(float(end))
             end_ts = end_dt.timestamp()
         elif isinstance(end, datetime):
@@ -421,12 +623,16 @@ class LogFilter:
     def by_task_uuid(self, *uuids: str) -> LogEntries:
         """Filter by task UUID(s).
 
+        With no UUIDs the filter is a no-op and returns the entries unscanned.
+
         Args:
             *uuids: One or more task UUIDs to include.
 
         Returns:
             LogEntries: Filtered entries.
         """
+        if not uuids:
+            return self._entries
         uuid_set = set(uuids)
         return self._entries.filter(lambda e: e.task_uuid in uuid_set)
 
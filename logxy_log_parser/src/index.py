@@ -6,14 +6,34 @@ Provides fast indexed lookups for large log files.
 
 from __future__ import annotations
 
+import bisect
 import gzip
+import io
 import json
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .core import LogEntry
+from .core import LogEntry, _json_loads
+
+# Read-ahead for line iteration; large reads amortize gzip's per-call overhead
+_READ_BUFFER_SIZE = 128 * 1024
+
+
+def _open_lines(path: Path) -> io.BufferedReader:
+    """Open a log file for binary line iteration, decompressing ``.gz`` files.
+
+    Args:
+        path: Log file path.
+
+    Returns:
+        io.BufferedReader: Reader yielding raw byte lines.
+    """
+    if str(path).endswith(".gz"):
+        return io.BufferedReader(gzip.GzipFile(path, "rb"), buffer_size=_READ_BUFFER_SIZE)
+    return open(path, "rb", buffering=_READ_BUFFER_SIZE)
 
 
 @dataclass
@@ -43,6 +63,11 @@ class IndexStats:
         }
 
 
+def _line_array() -> array[int]:
+    """Create an empty packed array of line numbers (unsigned 32-bit)."""
+    return array("I")
+
+
 @dataclass
 class LogPosition:
     """Position of a log entry in a file."""
@@ -62,6 +87,10 @@ class LogIndex:
     - Task UUID (for finding all entries in a task)
     - Level (for quick level filtering)
     - Time range (for time-based queries)
+
+    Task and level postings are packed arrays of line numbers, and the
+    sorted timestamps are kept in their own array so range lookups bisect
+    without rebuilding a key list per query.
     """
 
     def __init__(self, source: str | Path) -> None:
@@ -72,9 +101,10 @@ class LogIndex:
         """
         self._path = Path(source)
         self._entries_by_line: dict[int, LogPosition] = {}
-        self._entries_by_task: dict[str, list[int]] = defaultdict(list)
-        self._entries_by_level: dict[str, list[int]] = defaultdict(list)
+        self._entries_by_task: dict[str, array[int]] = defaultdict(_line_array)
+        self._entries_by_level: dict[str, array[int]] = defaultdict(_line_array)
         self._time_index: list[tuple[float, int]] = []  # (timestamp, line_number)
+        self._time_keys: array[float] = array("d")  # sorted timestamps of _time_index
         self._stats = IndexStats()
         self._built = False
 
@@ -112,10 +142,9 @@ class LogIndex:
 
         import time
 
-        # Handle gzip files
-        open_func = gzip.open if str(self._path).endswith(".gz") else open
-
-        with open_func(self._path, "rt", encoding="utf-8") as f:
+        # Binary mode: byte offsets are tracked from line lengths, since text
+        # files refuse tell() while being iterated
+        with _open_lines(self._path) as f:
             line_number = 0
             offset = 0
             task_uuids = set()
@@ -125,14 +154,14 @@ class LogIndex:
             for line in f:
                 line_start = offset
                 line_number += 1
-                offset = f.tell() if hasattr(f, "tell") else 0
+                offset += len(line)
 
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     timestamp = data.get("timestamp", 0)
                     if isinstance(timestamp, str):
                         timestamp = float(timestamp)
@@ -171,6 +200,7 @@ class LogIndex:
 
         # Sort time index
         self._time_index.sort()
+        self._time_keys = array("d", [t for t, _ in self._time_index])
 
         # Update stats
         self._stats = IndexStats(
@@ -195,7 +225,7 @@ class LogIndex:
         """
         if not self._built:
             self.build()
-        return [self._entries_by_line[n] for n in self._entries_by_task.get(task_uuid, [])]
+        return [self._entries_by_line[n] for n in self._entries_by_task.get(task_uuid, ())]
 
     def find_by_level(self, level: str) -> list[LogPosition]:
         """Find all entries at a log level.
@@ -208,7 +238,7 @@ class LogIndex:
         """
         if not self._built:
             self.build()
-        return [self._entries_by_line[n] for n in self._entries_by_level.get(level.lower(), [])]
+        return [self._entries_by_line[n] for n in self._entries_by_level.get(level.lower(), ())]
 
     def find_by_time_range(self, start: float, end: float) -> list[LogPosition]:
         """Find entries in a time range.
@@ -223,11 +253,8 @@ class LogIndex:
         if not self._built:
             self.build()
 
-        # Binary search for start
-        import bisect
-
-        start_idx = bisect.bisect_left([t for t, _ in self._time_index], start)
-        end_idx = bisect.bisect_right([t for t, _ in self._time_index], end)
+        start_idx = bisect.bisect_left(self._time_keys, start)
+        end_idx = bisect.bisect_right(self._time_keys, end)
 
         line_numbers = [ln for _, ln in self._time_index[start_idx:end_idx]]
         return [self._entries_by_line[n] for n in line_numbers if n in self._entries_by_line]
@@ -241,20 +268,17 @@ class LogIndex:
         Returns:
             list[LogEntry]: Loaded log entries.
         """
-        # Handle gzip files
-        open_func = gzip.open if str(self._path).endswith(".gz") else open
-
         entries = []
 
         # Group positions by line number for efficient access
         positions_by_line = {p.line_number: p for p in positions}
 
-        with open_func(self._path, "rt", encoding="utf-8") as f:
+        # Raw byte lines go straight to the JSON decoder without text decoding
+        with _open_lines(self._path) as f:
             for line_num, line in enumerate(f, 1):
                 if line_num in positions_by_line:
                     try:
-                        data = json.loads(line.strip())
-                        from .core import LogEntry
+                        data = _json_loads(line.strip())
                         entries.append(LogEntry.from_dict(data, line_num))
 
                         # Stop if we've loaded all requested entries
@@ -363,9 +387,10 @@ class LogIndex:
 
         # Restore data
         index._entries_by_line = data["entries_by_line"]
-        index._entries_by_task = defaultdict(list, data["entries_by_task"])
-        index._entries_by_level = defaultdict(list, data["entries_by_level"])
+        index._entries_by_task = defaultdict(_line_array, data["entries_by_task"])
+        index._entries_by_level = defaultdict(_line_array, data["entries_by_level"])
         index._time_index = data["time_index"]
+        index._time_keys = array("d", [t for t, _ in index._time_index])
         index._stats = data["stats"]
         index._built = True
 
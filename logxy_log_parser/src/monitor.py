@@ -9,13 +9,16 @@ Supports both compact and legacy field naming conventions.
 from __future__ import annotations
 
 import json
+import mmap
+import os
 import time
 from collections.abc import Callable, Iterator
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
-from common.types import MSG
-from .core import LogEntry, LogParser
+from common.types import MSG, get_level_value
+from .core import LogEntry, LogParser, _count_newlines, _iter_lines, _json_loads
 from .utils import get_field_value  # For flexible field access
 
 
@@ -63,24 +66,28 @@ class LogFile:
             return None
 
     def _refresh_file_state(self) -> None:
-        """Refresh internal file state."""
-        self._size = self._path.stat().st_size
+        """Refresh internal file state.
 
-        # Count lines
-        with open(self._path, encoding="utf-8") as f:
-            self._line_count = sum(1 for _ in f)
-
-        # Count valid entries
+        Lines and valid entries are counted in one pass over a read-only
+        memory map of the file.
+        """
+        self._line_count = 0
         self._entry_count = 0
-        with open(self._path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        json.loads(line)
-                        self._entry_count += 1
-                    except (json.JSONDecodeError, ValueError):
-                        pass
+
+        with open(self._path, "rb") as f:
+            self._size = os.fstat(f.fileno()).st_size
+            if self._size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                for line in _iter_lines(buf):
+                    self._line_count += 1
+                    line = line.strip()
+                    if line:
+                        try:
+                            _json_loads(line)
+                            self._entry_count += 1
+                        except (json.JSONDecodeError, ValueError):
+                            pass
 
     def _validate(self) -> None:
         """Validate that this is a valid LogXPy log file."""
@@ -130,6 +137,10 @@ class LogFile:
         Returns:
             Callable[[LogEntry], bool]: Predicate function.
         """
+        # Compare levels as Level values rather than by name
+        if isinstance(criteria.get("level"), str):
+            criteria["level"] = get_level_value(criteria["level"])
+
         def predicate(entry: LogEntry) -> bool:
             for key, value in criteria.items():
                 # Handle special operators
@@ -327,28 +338,43 @@ class LogFile:
     def tail(self, n: int = 10) -> list[LogEntry]:
         """Get last n entries from the file.
 
+        Lines are read backwards from the end of a memory map, so only the
+        tail of the file is parsed.
+
         Args:
             n: Number of entries to return.
 
         Returns:
             list[LogEntry]: Last n entries.
         """
-        entries: list[LogEntry] = []
-
-        with open(self._path, encoding="utf-8") as f:
-            for line_number, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    entries.append(LogEntry.from_dict(data, line_number))
-                    if len(entries) > n:
-                        entries.pop(0)
-                except (json.JSONDecodeError, ValueError, KeyError):
-                    continue
-
-        return entries
+        if n <= 0:
+            return []
+
+        # (lines from the end, entry) for the last n valid records, newest first
+        found: list[tuple[int, LogEntry]] = []
+
+        with open(self._path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                end = len(buf)
+                # A trailing newline ends the last line rather than starting an empty one
+                if buf[end - 1:end] == b"\n":
+                    end -= 1
+                back = 0
+                while len(found) < n and end >= 0:
+                    start = buf.rfind(b"\n", 0, end) + 1
+                    line = buf[start:end].strip()
+                    if line:
+                        try:
+                            found.append((back, LogEntry.from_dict(_json_loads(line))))
+                        except (json.JSONDecodeError, ValueError, KeyError):
+                            pass
+                    back += 1
+                    end = start - 1
+                total_lines = _count_newlines(buf, 0, end + 1) + back
+
+        return [replace(entry, line_number=total_lines - back) for back, entry in reversed(found)]
 
     def follow(
         self,
@@ -455,8 +481,10 @@ class LogFile:
         Yields:
             LogEntry: Matching new log entries.
         """
+        want_level = get_level_value(level) if level else None
+
         def filter_func(entry: LogEntry) -> bool:
-            if level and entry.level.value != level.lower():
+            if want_level is not None and entry.level != want_level:
                 return False
             if message and entry.message and message.lower() not in entry.message.lower():
                 return False
@@ -25,15 +25,51 @@ Example:
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import json
+import mmap
+import os
+import pickle
+from collections import Counter
 from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
 
-from common.types import Level
-from .core import LogEntry
-from .utils import bucketize
+from common.types import Level, get_level_value
+from . import __version__
+from .core import LogEntry, _iter_lines, _json_loads
+from .utils import bucketize, level_from_entry
+
+
+def _min_level_from_env() -> Level:
+    """Read the LOGXY_MIN_LEVEL threshold, defaulting to DEBUG (keep everything)."""
+    try:
+        return get_level_value(os.environ.get("LOGXY_MIN_LEVEL", "debug"))
+    except ValueError:
+        return Level.DEBUG
+
+
+# Lines below this level are dropped while reading, before a LogEntry is built
+_MIN_LEVEL: Level = _min_level_from_env()
+
+
+def _cache_dir_from_env() -> Path | None:
+    """Read LOGXY_CACHE: "1" uses ~/.cache/logxy, a path uses that directory, unset disables."""
+    value = os.environ.get("LOGXY_CACHE", "")
+    if value in ("", "0"):
+        return None
+    if value == "1":
+        return Path.home() / ".cache" / "logxy"
+    return Path(value).expanduser()
+
+
+# Parsed files are pickled here across processes; None disables the cache
+_CACHE_DIR: Path | None = _cache_dir_from_env()
+
+# Bump when the pickled result layout (LogEntry fields, result tuple) changes
+_CACHE_FORMAT = 1
 
 
 # ============================================================================
@@ -78,7 +114,7 @@ class CheckResult:
 
     def has_level(self, *levels: str) -> bool:
         """Check if entries with specified levels exist."""
-        level_set = set(Level(l) for l in levels)
+        level_set = frozenset(map(get_level_value, levels))
         return any(e.level in level_set for e in self.entries)
 
     def has_action(self, *action_types: str) -> bool:
@@ -96,6 +132,7 @@ class CheckResult:
         >>> result.contains(level="error")
         >>> result.contains(action_type="db:query", status="failed")
         """
+        criteria = _normalize_criteria(criteria)
         return any(
             all(
                 getattr(e, k, None) == v
@@ -107,6 +144,7 @@ class CheckResult:
 
     def find(self, **criteria: Any) -> list[LogEntry]:
         """Find all entries matching criteria."""
+        criteria = _normalize_criteria(criteria)
         return [
             e for e in self.entries
             if all(
@@ -118,6 +156,7 @@ class CheckResult:
 
     def first(self, **criteria: Any) -> LogEntry | None:
         """Get first entry matching criteria."""
+        criteria = _normalize_criteria(criteria)
         for e in self.entries:
             if all(
                 getattr(e, k, None) == v
@@ -129,6 +168,7 @@ class CheckResult:
 
     def count(self, **criteria: Any) -> int:
         """Count entries matching criteria."""
+        criteria = _normalize_criteria(criteria)
         return sum(
             1 for e in self.entries
             if all(
@@ -238,37 +278,133 @@ class AnalysisReport:
 # One-Line API Functions
 # ============================================================================
 
-def parse_log(source: str | Path) -> list[LogEntry]:
-    """Parse a log file in ONE LINE.
+def _parse_cached(
+    path: str, mtime_ns: int, size: int, min_level: Level = Level.DEBUG
+) -> tuple[tuple[LogEntry, ...], int]:
+    """Parse a log file, through the on-disk cache when ``LOGXY_CACHE`` is set.
 
-    Feature: Python-native - returns standard list[LogEntry]
+    Nothing is kept in memory between calls, so every caller gets its own
+    entries and may mutate them freely. With ``LOGXY_CACHE`` set, results
+    are pickled to disk, one file per path holding the latest snapshot;
+    log files are append-only, so the (mtime, size) pair is a reliable
+    freshness check and unchanged files are loaded instead of parsed.
+    Unusable cache files are discarded, never raised.
 
     Args:
-        source: Path to log file
+        path: Resolved path to log file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        min_level: Skip records below this level without building entries
 
     Returns:
-        List of LogEntry objects
+        Tuple of (parsed entries, total line count)
+    """
+    if _CACHE_DIR is None:
+        return _read_entries(path, size, min_level)
 
-    Example:
-        >>> entries = parse_log("app.log")
-        >>> for entry in entries:
-        ...     print(entry.message)
+    # One file per (path, level): a new snapshot of the log overwrites the old one
+    key = hashlib.blake2b(f"{path}:{int(min_level)}".encode(), digest_size=8)
+    cache_file = _CACHE_DIR / f"{key.hexdigest()}.pkl"
+    header = (_CACHE_FORMAT, __version__, mtime_ns, size)
+    try:
+        with open(cache_file, "rb") as f:
+            # The header is checked before the entries are unpickled, so a
+            # stale snapshot or another version's layout is never loaded
+            if pickle.load(f) == header:
+                return pickle.load(f)  # type: ignore[no-any-return]
+    except OSError:
+        pass  # Missing or unreadable: parse and rewrite it
+    except Exception:
+        # Truncated or written by an incompatible version; drop it
+        with contextlib.suppress(OSError):
+            cache_file.unlink()
+
+    result = _read_entries(path, size, min_level)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)  # Readers never see a partial file
+    except OSError:
+        pass  # The disk cache is best-effort
+    return result
+
+
+def _read_entries(path: str, size: int, min_level: Level) -> tuple[tuple[LogEntry, ...], int]:
+    """Read and parse every line of a log file.
+
+    Args:
+        path: Resolved path to log file
+        size: File size in bytes
+        min_level: Skip records below this level without building entries
+
+    Returns:
+        Tuple of (parsed entries, total line count)
     """
-    path = Path(source)
     entries: list[LogEntry] = []
-
-    with open(path, encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
+    line_num = 0
+    filter_level = min_level > Level.DEBUG
+    if size == 0:
+        return (), 0
+
+    # Lines are sliced straight from a read-only map and decoded as bytes
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        for line_num, line in enumerate(_iter_lines(buf), 1):
             line = line.strip()
             if not line:
                 continue
             try:
-                data = json.loads(line)
+                data = _json_loads(line)
+                if filter_level and level_from_entry(data) < min_level:
+                    continue
                 entries.append(LogEntry.from_dict(data, line_number=line_num))
             except (json.JSONDecodeError, ValueError):
                 pass  # Skip invalid lines
 
-    return entries
+    return tuple(entries), line_num
+
+
+def _parse_with_lines(source: str | Path) -> tuple[list[LogEntry], int]:
+    """Parse a log file, using the on-disk cache when enabled.
+
+    Args:
+        source: Path to log file
+
+    Returns:
+        Tuple of (fresh list of entries, total line count)
+    """
+    path = Path(source).resolve()
+    st = path.stat()
+    entries, total_lines = _parse_cached(str(path), st.st_mtime_ns, st.st_size, _MIN_LEVEL)
+    return list(entries), total_lines
+
+
+def parse_log(source: str | Path) -> list[LogEntry]:
+    """Parse a log file in ONE LINE.
+
+    Feature: Python-native - returns standard list[LogEntry]
+
+    Each call returns freshly built entries. Set the ``LOGXY_MIN_LEVEL``
+    environment variable (e.g. ``info``) before import to drop lower-level
+    records while reading; this also applies to check_log() and
+    analyze_log(). Set ``LOGXY_CACHE=1`` (or to a directory) to keep
+    parsed files in an on-disk pickle cache shared between runs; only point
+    it at a directory you trust, since cached files are unpickled.
+
+    Args:
+        source: Path to log file
+
+    Returns:
+        List of LogEntry objects
+
+    Example:
+        >>> entries = parse_log("app.log")
+        >>> for entry in entries:
+        ...     print(entry.message)
+    """
+    return _parse_with_lines(source)[0]
 
 
 def parse_line(line: str) -> LogEntry | None:
@@ -286,7 +422,7 @@ def parse_line(line: str) -> LogEntry | None:
         ...     print(entry.message)
     """
     try:
-        data = json.loads(line.strip())
+        data = _json_loads(line.strip())
         return LogEntry.from_dict(data)
     except (json.JSONDecodeError, ValueError):
         return None
@@ -313,7 +449,7 @@ def check_log(source: str | Path) -> CheckResult:
         ...     print("Has HTTP errors")
     """
     path = Path(source)
-    entries = parse_log(path)
+    entries, total_lines = _parse_with_lines(path)
 
     # Count errors
     error_count = sum(1 for e in entries if e.is_error)
@@ -329,7 +465,7 @@ def check_log(source: str | Path) -> CheckResult:
     return CheckResult(
         entries=entries,
         file_path=path,
-        total_lines=sum(1 for _ in open(path, encoding="utf-8")),
+        total_lines=total_lines,
         error_count=error_count,
         validation_errors=validation_errors,
     )
@@ -402,38 +538,88 @@ def analyze_log(source: str | Path) -> AnalysisReport:
 # Type & Count Helper Functions (Feature b)
 # ============================================================================
 
+@overload
 def count_by(
     entries: Iterable[LogEntry],
+    key: None = None,
     *,
     level: str | None = None,
     action_type: str | None = None,
     action_status: str | None = None,
-) -> int:
-    """Count entries matching criteria.
+) -> int: ...
+
+
+@overload
+def count_by(
+    entries: Iterable[LogEntry],
+    key: str,
+    *,
+    level: str | None = None,
+    action_type: str | None = None,
+    action_status: str | None = None,
+) -> dict[Any, int]: ...
+
+
+def count_by(
+    entries: Iterable[LogEntry],
+    key: str | None = None,
+    *,
+    level: str | None = None,
+    action_type: str | None = None,
+    action_status: str | None = None,
+) -> int | dict[Any, int]:
+    """Count entries matching criteria, or tally them by a field.
 
     Feature: Type & count - simplified counting
 
     Args:
         entries: Iterable of log entries
+        key: Field name to tally by (attribute or fields dict key).
+            When given, returns a value -> count mapping of the entries
+            matching the filters instead of an int.
         level: Filter by log level
         action_type: Filter by action type
         action_status: Filter by action status
 
     Returns:
-        Count of matching entries
+        Count of matching entries, or mapping of field value to count
 
     Example:
         >>> errors = count_by(entries, level="error")
         >>> db_queries = count_by(entries, action_type="db:query")
         >>> failed = count_by(entries, action_status="failed")
+        >>> by_level = count_by(entries, key="level")
+        >>> failed_by_action = count_by(entries, "action_type", action_status="failed")
     """
-    return sum(
-        1 for e in entries
-        if (level is None or e.level.value == level)
+    want_level = None if level is None else get_level_value(level)
+    matching = (
+        e for e in entries
+        if (want_level is None or e.level == want_level)
         and (action_type is None or e.action_type == action_type)
         and (action_status is None or (e.action_status and e.action_status.value == action_status))
     )
 
+    if key is not None:
+        # Counter tallies in C; no intermediate buckets are built
+        return dict(Counter(map(_field_getter(key), matching)))
+    return sum(1 for _ in matching)
+
+
+def _normalize_criteria(criteria: dict[str, Any]) -> dict[str, Any]:
+    """Resolve a level name criterion to its Level so matches compare as ints."""
+    if isinstance(criteria.get("level"), str):
+        return {**criteria, "level": get_level_value(criteria["level"])}
+    return criteria
+
+
+def _field_getter(key: str) -> Callable[[LogEntry], Any]:
+    """Build a getter reading an entry attribute, falling back to its fields dict."""
+    def get(e: LogEntry) -> Any:
+        val = getattr(e, key, None)
+        return e.fields.get(key) if val is None else val
+
+    return get
+
 
 def group_by(
     entries: Iterable[LogEntry],
@@ -479,14 +665,7 @@ def types(entries: Iterable[LogEntry], field_name: str = "action_type") -> set[s
         >>> action_types = types(entries, "action_type")
         >>> levels = types(entries, "level")
     """
-    unique_values = set()
-    for e in entries:
-        val = getattr(e, field_name, None)
-        if val is None:
-            val = e.fields.get(field_name)
-        if val is not None:
-            unique_values.add(str(val))
-    return unique_values
+    return {str(val) for val in map(_field_getter(field_name), entries) if val is not None}
 
 
 # ============================================================================
@@ -6,6 +6,7 @@ Contains TaskNode and TaskTree for hierarchical task representation.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -133,9 +134,10 @@ class TaskTree:
             root: Root node of the tree.
         """
         self._root = root
+        self._max_depth: int | None = None
 
     @classmethod
-    def from_entries(cls, entries: list[LogEntry], task_uuid: str) -> TaskTree:
+    def from_entries(cls, entries: Sequence[LogEntry], task_uuid: str) -> TaskTree:
         """Build tree from log entries using logxpy format.
 
         In logxpy, the task_level works as follows:
@@ -435,9 +437,14 @@ class TaskTree:
     def deepest_nesting(self) -> int:
         """Get the maximum nesting depth in the tree.
 
+        Computed on first use and remembered for this tree.
+
         Returns:
             int: Maximum nesting depth.
         """
+        if self._max_depth is not None:
+            return self._max_depth
+
         max_depth = 0
 
         def traverse(node: TaskNode, depth: int) -> None:
@@ -447,6 +454,7 @@ class TaskTree:
                 traverse(child, depth + 1)
 
         traverse(self._root, 0)
+        self._max_depth = max_depth
         return max_depth
 
     def get_stats(self) -> dict[str, Any]:
@@ -0,0 +1,251 @@
+"""Tests for aggregation functionality."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from logxy_log_parser import LogAggregator, LogParser, MultiFileAnalyzer, TimeSeriesAnalyzer
+
+
+class TestLogAggregator:
+    """Tests for LogAggregator class."""
+
+    def test_aggregate_multiple_files(self, sample_log_path: Path, tmp_path: Path) -> None:
+        """Test aggregating a plain and a gzipped log file."""
+        gz_path = tmp_path / "sample.log.gz"
+        with open(sample_log_path, "rb") as src, gzip.open(gz_path, "wb") as dst:
+            dst.write(src.read())
+
+        expected = len(LogParser(sample_log_path).parse())
+        aggregator = LogAggregator([sample_log_path, gz_path])
+        entries = aggregator.aggregate()
+
+        assert len(entries) == 2 * expected
+        assert aggregator.stats.total_files == 2
+        assert aggregator.stats.file_stats[str(gz_path)]["entries"] == expected
+
+    def test_corrupt_gzip_is_skipped(self, sample_log_path: Path, tmp_path: Path) -> None:
+        """Test a truncated or non-gzip .gz source is skipped like an unreadable file."""
+        data = gzip.compress(sample_log_path.read_bytes())
+        truncated = tmp_path / "truncated.log.gz"
+        truncated.write_bytes(data[: len(data) // 2])
+        bogus = tmp_path / "bogus.log.gz"
+        bogus.write_bytes(b"not gzip at all\n")
+
+        expected = len(LogParser(sample_log_path).parse())
+        for sources in ([truncated], [truncated, bogus, sample_log_path]):
+            aggregator = LogAggregator(sources)
+            assert len(aggregator.aggregate()) == (expected if sample_log_path in sources else 0)
+            assert str(truncated) not in aggregator.stats.file_stats
+
+    def test_aggregate_reuses_unchanged_files(self, sample_log_path: Path) -> None:
+        """Test re-aggregating an unchanged file reuses the parsed entries only when caching."""
+        LogAggregator.clear_cache()
+        first = LogAggregator([sample_log_path], cache=True).aggregate()
+        second = LogAggregator([sample_log_path], cache=True).aggregate()
+        uncached = LogAggregator([sample_log_path]).aggregate()
+
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert not any(a is b for a, b in zip(first, uncached, strict=True))
+
+        LogAggregator.clear_cache()
+        third = LogAggregator([sample_log_path], cache=True).aggregate()
+        assert not any(a is b for a, b in zip(first, third, strict=True))
+        LogAggregator.clear_cache()
+
+    def test_parse_cache_bounded_by_bytes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the shared parse cache evicts least recently used files past its byte budget."""
+        from logxy_log_parser.src import aggregation
+
+        paths = []
+        for n in range(3):
+            path = tmp_path / f"f{n}.log"
+            path.write_text(json.dumps({"tid": f"t{n}", "ts": float(n)}) + "\n")
+            paths.append(path)
+        size = paths[0].stat().st_size
+        monkeypatch.setattr(aggregation, "_FILE_CACHE", aggregation._ParseCache(max_bytes=2 * size))
+
+        LogAggregator(paths[:2], cache=True).aggregate()
+        LogAggregator(paths[:1], cache=True).aggregate()  # f0 becomes most recently used
+        LogAggregator(paths[2:], cache=True).aggregate()
+
+        assert [key[0] for key in aggregation._FILE_CACHE._items] == [str(paths[0]), str(paths[2])]
+
+    def test_aggregate_sees_rewritten_file(self, sample_log_path: Path) -> None:
+        """Test appending to a file invalidates its cached parse."""
+        before = len(LogAggregator([sample_log_path], cache=True).aggregate())
+
+        with open(sample_log_path, "a") as f:
+            f.write(json.dumps({"tid": "new", "ts": 1738332999.0, "mt": "loggerx:info"}) + "\n")
+        st = os.stat(sample_log_path)
+        os.utime(sample_log_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert len(LogAggregator([sample_log_path], cache=True).aggregate()) == before + 1
+        LogAggregator.clear_cache()
+
+    def test_aggregate_skips_missing_files(self, sample_log_path: Path, tmp_path: Path) -> None:
+        """Test unreadable sources are skipped."""
+        aggregator = LogAggregator([sample_log_path, tmp_path / "missing.log"])
+        entries = aggregator.aggregate()
+
+        assert len(entries) == len(LogParser(sample_log_path).parse())
+        assert str(tmp_path / "missing.log") not in aggregator.stats.file_stats
+
+    def test_aggregate_parallel_matches_serial(
+        self, sample_log_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test pool parsing keeps source order, stats and progress reporting."""
+        from logxy_log_parser.src import aggregation
+
+        sources = []
+        for n in range(3):
+            path = tmp_path / f"part{n}.log"
+            with open(path, "w") as f:
+                for i in range(50):
+                    f.write(json.dumps({"tid": f"p{n}", "ts": float(n * 100 + i)}) + "\n")
+            sources.append(path)
+        sources.append(tmp_path / "missing.log")
+
+        serial = LogAggregator(sources)
+        expected = [(e.task_uuid, e.timestamp) for e in serial.aggregate(workers=1)]
+
+        monkeypatch.setattr(aggregation, "_PARALLEL_MIN_BYTES", 0)
+        progress: list[tuple[int, int]] = []
+        parallel = LogAggregator(sources)
+        entries = parallel.aggregate(lambda cur, tot: progress.append((cur, tot)), workers=3)
+
+        assert [(e.task_uuid, e.timestamp) for e in entries] == expected
+        assert parallel.stats.to_dict() == serial.stats.to_dict()
+        assert progress == [(i, 4) for i in range(1, 5)]
+
+    def test_iter_entries_streams_like_aggregate(self, sample_log_path: Path, tmp_path: Path) -> None:
+        """Test streaming yields the aggregated entries and ends with the same stats."""
+        gz_path = tmp_path / "sample.log.gz"
+        with open(sample_log_path, "rb") as src, gzip.open(gz_path, "wb") as dst:
+            dst.write(src.read())
+        sources = [sample_log_path, tmp_path / "missing.log", gz_path]
+
+        aggregated = LogAggregator(sources)
+        expected = [(e.task_uuid, e.timestamp) for e in aggregated.aggregate()]
+        streaming = LogAggregator(sources)
+        streamed = [(e.task_uuid, e.timestamp) for e in streaming.iter_entries()]
+
+        assert streamed == expected
+        assert streaming.stats.to_dict() == aggregated.stats.to_dict()
+
+
+class TestMultiFileAnalyzer:
+    """Tests for MultiFileAnalyzer class."""
+
+    def test_time_series_matches_buckets(self, tmp_path: Path) -> None:
+        """Test time_series_analysis agrees with TimeSeriesAnalyzer buckets."""
+        levels = ["info", "error", "warning", "critical"]
+        for n in range(2):
+            with open(tmp_path / f"app{n}.log", "w") as f:
+                for i in range(120):
+                    f.write(json.dumps({
+                        "tid": f"t{i % 4}",
+                        "ts": 1738332000.0 + n * 17.5 + i * 37.25,
+                        "mt": f"loggerx:{levels[(i + n) % 4]}",
+                    }) + "\n")
+
+        analyzer = MultiFileAnalyzer(tmp_path)
+        series = analyzer.time_series_analysis(interval_seconds=600)
+
+        entries = LogAggregator(sorted(tmp_path.glob("*.log"))).aggregate()
+        buckets = TimeSeriesAnalyzer(entries).bucket_by_interval(600)
+
+        assert series == [
+            {
+                "timestamp": b.start,
+                "count": b.count,
+                "error_count": b.error_count,
+                "error_rate": b.error_rate,
+            }
+            for b in buckets
+        ]
+
+    def test_scan_matches_plain_then_gzipped(self, tmp_path: Path) -> None:
+        """Test one directory scan finds plain logs, then gzipped logs, sorted."""
+        for name in ["b.log", "a.log", "c.log.gz", "notes.txt"]:
+            (tmp_path / name).write_text("")
+
+        analyzer = MultiFileAnalyzer(tmp_path)
+
+        assert analyzer.file_count == 3
+        assert [f.name for f in analyzer._files] == ["a.log", "b.log", "c.log.gz"]
+        assert MultiFileAnalyzer(tmp_path / "missing").file_count == 0
+        assert MultiFileAnalyzer(tmp_path, max_files=2).file_count == 2
+        assert MultiFileAnalyzer(tmp_path, max_files=0).file_count == 0
+
+    def test_analyses_share_one_aggregation(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test analyze_all and time_series_analysis aggregate the files once."""
+        with open(tmp_path / "app.log", "w") as f:
+            for i in range(10):
+                f.write(json.dumps({"tid": "a", "ts": 1738332000.0 + i, "mt": "loggerx:error"}) + "\n")
+
+        calls = []
+        aggregate = LogAggregator.aggregate
+        monkeypatch.setattr(LogAggregator, "aggregate", lambda self: calls.append(1) or aggregate(self))
+
+        analyzer = MultiFileAnalyzer(tmp_path)
+        result = analyzer.analyze_all()
+        series = analyzer.time_series_analysis(interval_seconds=60)
+
+        assert len(calls) == 1
+        assert result["aggregation_stats"]["total_entries"] == 10
+        assert series[0]["error_count"] == 10
+
+
+class TestTimeSeriesAnalyzer:
+    """Tests for TimeSeriesAnalyzer class."""
+
+    def test_detect_anomalies_spike(self) -> None:
+        """Test a burst of entries in one minute is reported as a spike."""
+        from logxy_log_parser import LogEntry
+
+        base = 1738332000.0
+        entries = [
+            LogEntry.from_dict({"tid": "a", "ts": base + minute * 60 + i})
+            for minute in range(30)
+            for i in range(40 if minute == 15 else 2 + minute % 2)
+        ]
+
+        anomalies = TimeSeriesAnalyzer(entries).detect_anomalies(window_size=5, threshold=3.0)
+
+        assert [a["timestamp"] for a in anomalies] == [base + 15 * 60]
+        assert anomalies[0]["type"] == "spike"
+        assert anomalies[0]["expected"] == 2.4
+
+    def test_activity_heatmap_matches_per_entry_conversion(self) -> None:
+        """Test the heatmap agrees with converting every timestamp separately."""
+        import random
+        from collections import defaultdict
+        from datetime import datetime
+
+        from logxy_log_parser import LogEntry
+
+        rng = random.Random(7)
+        entries = [
+            LogEntry.from_dict({
+                "tid": "a",
+                "ts": 1738332000.0 + rng.uniform(0, 9 * 86400),
+                "mt": f"loggerx:{rng.choice(['info', 'error'])}",
+            })
+            for _ in range(500)
+        ]
+        analyzer = TimeSeriesAnalyzer(entries)
+
+        for hourly in (False, True):
+            expected: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            for e in entries:
+                dt = datetime.fromtimestamp(e.timestamp)
+                outer, inner = (dt.hour, dt.weekday()) if hourly else (dt.strftime("%A"), dt.hour)
+                expected[str(outer)][f"{inner}_{e.level.value}"] += 1
+
+            assert analyzer.activity_heatmap(hour_granularity=hourly) == expected
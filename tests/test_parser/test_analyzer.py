@@ -187,3 +187,91 @@ class TestLogAnalyzer:
 
         with pytest.raises(ValueError):
             analyzer.generate_report("unsupported")
+
+    def test_timeline_counts(self) -> None:
+        """Test timeline buckets entries regardless of input order."""
+        from logxy_log_parser import LogEntry
+
+        logs = [
+            LogEntry.from_dict({"tid": "t", "ts": ts, "mt": "info"})
+            for ts in (130.0, 0.0, 10.0, 59.9, 60.0, 200.0)
+        ]
+
+        timeline = LogAnalyzer(logs).timeline(interval="1min")
+
+        assert [p.start for p in timeline.intervals] == [0.0, 60.0, 120.0, 180.0]
+        assert [p.entry_count for p in timeline.intervals] == [3, 1, 1, 1]
+        assert timeline.total_entries == 6
+
+    def test_duration_percentiles_interpolate(self) -> None:
+        """Test duration percentiles interpolate linearly between samples."""
+        from logxy_log_parser import LogEntry
+
+        logs = [
+            LogEntry.from_dict({"tid": "t", "ts": float(i), "at": "job", "dur": float(d)})
+            for i, d in enumerate(range(1, 11))
+        ]
+
+        stats = LogAnalyzer(logs).duration_by_action()["job"]
+
+        assert stats.median == 5.5
+        assert stats.p25 == 3.25
+        assert stats.p75 == 7.75
+        assert stats.p95 == pytest.approx(9.55)
+        assert stats.p99 == pytest.approx(9.91)
+        assert (stats.min, stats.max) == (1.0, 10.0)
+
+    def test_parse_interval_units(self) -> None:
+        """Test interval strings parse by unit, with bare numbers as minutes."""
+        parse = LogAnalyzer._parse_interval
+
+        assert [parse(s) for s in ("30s", "2 sec", "1min", "5m", "1hour", "2h", "1day", "1.5")] == [
+            30.0, 2.0, 60.0, 300.0, 3600.0, 7200.0, 86400.0, 90.0,
+        ]
+        with pytest.raises(ValueError):
+            parse("fortnight")
+
+    def test_orphans_unclosed_and_duplicate_starts(self) -> None:
+        """Test orphans reports re-starts of open actions and starts never closed, in log order."""
+        from logxy_log_parser import LogEntry
+
+        events = [
+            ("a", "db", "started"),
+            ("a", "db", "succeeded"),
+            ("a", "http", "started"),
+            ("a", "http", "started"),
+            ("a", "http", "failed"),
+            ("b", "db", "started"),
+            ("b", "db", "succeeded"),
+            ("b", "db", "succeeded"),
+        ]
+        logs = [
+            LogEntry.from_dict({"tid": tid, "ts": float(i), "at": at, "st": st})
+            for i, (tid, at, st) in enumerate(events)
+        ]
+
+        orphans = LogAnalyzer(logs).orphans()
+
+        assert [e.timestamp for e in orphans] == [2.0, 3.0]
+
+    def test_html_report_escapes_values(self) -> None:
+        """Test log-derived values are HTML-escaped in the report."""
+        from logxy_log_parser import LogEntry
+
+        logs = [LogEntry.from_dict({"tid": "<t>", "ts": 1.0, "mt": "loggerx:error", "msg": "a & <b>"})]
+
+        report = LogAnalyzer(logs).generate_report("html")
+
+        assert "<strong>a &amp; &lt;b&gt;</strong>" in report
+        assert "<li>&lt;t&gt;: 1 entries</li>" in report
+
+    def test_timeline_cached_per_interval(self) -> None:
+        """Test equal intervals reuse one timeline and different ones do not."""
+        from logxy_log_parser import LogEntry
+
+        logs = [LogEntry.from_dict({"tid": "t", "ts": float(i * 7)}) for i in range(100)]
+        analyzer = LogAnalyzer(logs)
+
+        assert analyzer.timeline("1min") is analyzer.timeline("60s")
+        assert analyzer.timeline("5min") is not analyzer.timeline("1min")
+        assert analyzer.peak_periods(1)[0].entry_count == 9
@@ -102,6 +102,23 @@ class TestLogEntry:
         entry = LogEntry.from_dict(data)
         assert entry.level == Level.INFO
 
+    def test_level_resolved_on_direct_construction(self) -> None:
+        """Test level and is_error are derived when constructing LogEntry directly."""
+        entry = LogEntry(
+            timestamp=1738332000.0,
+            task_uuid="test-uuid",
+            task_level=(1,),
+            message_type="loggerx:critical",
+            message="boom",
+            action_type=None,
+            action_status=None,
+            duration=None,
+            fields={},
+        )
+
+        assert entry.level == Level.CRITICAL
+        assert entry.is_error
+
     def test_is_error_property(self) -> None:
         """Test is_error property."""
         error_data = {
@@ -244,6 +261,88 @@ class TestLogParser:
 
         assert len(entries) == 2
 
+    def test_parse_line_numbers_and_errors(self, tmp_path: str) -> None:
+        """Test line numbers survive blank lines and a missing final newline."""
+        import os
+
+        log_file = os.path.join(tmp_path, "numbered.log")
+
+        with open(log_file, "w") as f:
+            f.write('{"tid": "a", "ts": 1.0}\n')
+            f.write("\n")
+            f.write("not json\n")
+            f.write('{"tid": "a", "ts": 2.0}')
+
+        parser = LogParser(log_file)
+        entries = parser.parse()
+
+        assert [e.line_number for e in entries] == [1, 4]
+        assert [e.line_number for e in parser.errors] == [3]
+        assert parser.errors[0].line == "not json"
+
+    def test_parse_empty_file(self, tmp_path: str) -> None:
+        """Test parsing an empty file yields no entries."""
+        import os
+
+        log_file = os.path.join(tmp_path, "empty.log")
+        open(log_file, "w").close()
+
+        assert LogParser(log_file).parse() == []
+
+    def test_parse_fifo(self, tmp_path: str) -> None:
+        """Test a named pipe, which reports size 0 and cannot be mapped, is still read."""
+        import os
+        import threading
+
+        if not hasattr(os, "mkfifo"):
+            pytest.skip("requires os.mkfifo")
+        fifo = os.path.join(tmp_path, "pipe.log")
+        os.mkfifo(fifo)
+
+        def write() -> None:
+            with open(fifo, "w") as f:
+                f.write('{"tid": "a", "ts": 1.0}\n')
+                f.write("not json\n")
+                f.write('{"tid": "a", "ts": 2.0}\n')
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        parser = LogParser(fifo)
+        entries = parser.parse()
+        writer.join()
+
+        assert [e.timestamp for e in entries] == [1.0, 2.0]
+        assert [e.line_number for e in parser.errors] == [2]
+        assert parser.errors[0].line == "not json"
+
+    def test_parse_parallel_matches_parse(
+        self, tmp_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test parallel parsing keeps order, line numbers and errors."""
+        import os
+
+        from logxy_log_parser.src import core
+
+        monkeypatch.setattr(core, "_PARALLEL_MIN_BYTES", 0)
+        # Count line offsets across several chunks per range
+        monkeypatch.setattr(core, "_COUNT_CHUNK", 64)
+        log_file = os.path.join(tmp_path, "parallel.log")
+
+        with open(log_file, "w") as f:
+            for i in range(200):
+                f.write(json.dumps({"tid": f"t{i % 7}", "ts": float(i), "mt": "loggerx:info"}) + "\n")
+                if i % 50 == 0:
+                    f.write("broken\n")
+
+        expected = LogParser(log_file)
+        parser = LogParser(log_file)
+        entries = parser.parse_parallel(workers=3)
+
+        assert [(e.line_number, e.timestamp) for e in entries] == [
+            (e.line_number, e.timestamp) for e in expected.parse()
+        ]
+        assert [e.line_number for e in parser.errors] == [e.line_number for e in expected.errors]
+
     def test_parser_caching(self, sample_log_path: str) -> None:
         """Test that parse results are cached."""
         parser = LogParser(sample_log_path)
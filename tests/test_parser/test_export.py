@@ -30,6 +30,40 @@ class TestExport:
         assert isinstance(data, list)
         assert len(data) > 0
 
+    def test_export_to_json_matches_stdlib_encoding(self, tmp_path: str) -> None:
+        """Test JSON export keeps big integers and rejects datetimes with either encoder."""
+        import os
+        from datetime import datetime
+
+        from logxy_log_parser import LogEntries, LogEntry
+
+        output_file = os.path.join(tmp_path, "big.json")
+        entry = LogEntry.from_dict({"tid": "a", "ts": 1.0, "big": 2**70})
+        LogEntries([entry]).to_json(output_file)
+
+        with open(output_file) as f:
+            assert json.load(f)[0]["big"] == 2**70
+
+        entry.fields["when"] = datetime(2024, 1, 1)
+        with pytest.raises(TypeError):
+            LogEntries([entry]).to_json(output_file)
+
+    def test_export_to_json_writes_nan_as_null_with_orjson(self, tmp_path: str) -> None:
+        """Test the orjson encoder writes non-finite floats as null."""
+        import os
+
+        pytest.importorskip("orjson")
+        from logxy_log_parser import LogEntries, LogEntry
+
+        output_file = os.path.join(tmp_path, "nan.json")
+        entry = LogEntry.from_dict({"tid": "a", "ts": 1.0, "ratio": float("nan"), "peak": float("inf")})
+        LogEntries([entry]).to_json(output_file)
+
+        with open(output_file) as f:
+            data = json.load(f)[0]
+        assert data["ratio"] is None
+        assert data["peak"] is None
+
     def test_export_to_csv(self, sample_log_path: str, tmp_path: str) -> None:
         """Test exporting to CSV."""
         from logxy_log_parser import LogFilter, LogParser
@@ -118,3 +152,36 @@ class TestExport:
 
         csv_file = os.path.join(tmp_path, "empty.csv")
         entries.to_csv(csv_file)
+
+    def test_export_rows_shared_across_formats(self, sample_log_path: str, tmp_path: str) -> None:
+        """Test exporters reuse one cached row projection per collection."""
+        from logxy_log_parser import LogEntries, LogParser
+
+        import csv
+        import os
+
+        entries = LogEntries(LogParser(sample_log_path).parse())
+        rows = entries._export_rows()
+
+        csv_file = os.path.join(tmp_path, "rows.csv")
+        entries.to_csv(csv_file)
+
+        assert entries._export_rows() is rows
+        with open(csv_file, newline="") as f:
+            written = list(csv.DictReader(f))
+        assert [r["task_uuid"] for r in written] == [e.task_uuid for e in entries]
+
+    def test_to_all_writes_each_format(self, sample_log_path: str, tmp_path: str) -> None:
+        """Test to_all writes one file per format matching the single-format exports."""
+        from pathlib import Path
+
+        from logxy_log_parser import LogEntries, LogParser
+
+        entries = LogEntries(LogParser(sample_log_path).parse())
+        written = entries.to_all(tmp_path, ["csv", "json"], stem="all")
+
+        assert written == {"csv": Path(tmp_path) / "all.csv", "json": Path(tmp_path) / "all.json"}
+        entries.to_csv(Path(tmp_path) / "single.csv")
+        assert written["csv"].read_bytes() == (Path(tmp_path) / "single.csv").read_bytes()
+        with pytest.raises(ValueError):
+            entries.to_all(tmp_path, ["pdf"])
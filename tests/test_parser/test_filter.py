@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from logxy_log_parser import LogFilter, LogParser
+from logxy_log_parser import LogEntries, LogEntry, LogFilter, LogParser
 from logxy_log_parser import Level
 
 
@@ -39,6 +39,21 @@ class TestLogFilter:
 
         assert all(e.level == Level.WARNING for e in warnings)
 
+    def test_by_level_names_and_values(self) -> None:
+        """Test by_level accepts level names in any case and Level values."""
+        logs = [
+            LogEntry.from_dict({"tid": "a", "ts": 1.0, "mt": f"loggerx:{name}"})
+            for name in ["info", "error", "warning", "critical", "debug"]
+        ]
+
+        by_name = LogFilter(logs).by_level("ERROR", "warning")
+        by_value = LogFilter(logs).by_level(Level.ERROR, Level.WARNING)
+
+        assert [e.level for e in by_name] == [Level.ERROR, Level.WARNING]
+        assert [e.level for e in by_value] == [Level.ERROR, Level.WARNING]
+        with pytest.raises(ValueError):
+            LogFilter(logs).by_level("loud")
+
     def test_by_message(self, sample_log_path: str) -> None:
         """Test filtering by message content."""
         parser = LogParser(sample_log_path)
@@ -58,6 +73,67 @@ class TestLogFilter:
 
         assert all(e.message and "payment" in e.message.lower() for e in result)
 
+    def test_by_messages_any_pattern(self) -> None:
+        """Test multi-pattern message filtering in literal and regex modes."""
+        logs = [
+            LogEntry.from_dict({"tid": "a", "ts": float(i), "msg": msg})
+            for i, msg in enumerate(["Payment OK", "cache miss (x2)", "user login", "disk full"])
+        ]
+
+        literal = LogFilter(logs).by_messages("payment", "(x2)")
+        regex = LogFilter(logs).by_messages(r"^user\b", r"full$", regex=True)
+
+        assert [e.message for e in literal] == ["Payment OK", "cache miss (x2)"]
+        assert [e.message for e in regex] == ["user login", "disk full"]
+
+    def test_by_messages_groups_and_inline_flags(self) -> None:
+        """Test backreferences and leading inline flags keep their meaning per pattern."""
+        logs = [
+            LogEntry.from_dict({"tid": "a", "ts": float(i), "msg": msg})
+            for i, msg in enumerate(["retry retry", "ab", "first\nsecond", "plain"])
+        ]
+        f = LogFilter(logs)
+
+        # Without per-pattern compilation \1 would point at the first pattern's group
+        repeated = f.by_messages(r"(a)(b)x", r"(\w+) \1", regex=True)
+        # A non-leading (?s) is a compile error inside a combined alternation
+        dotall = f.by_messages("nothing", r"(?s)first.second", regex=True)
+
+        assert [e.message for e in repeated] == ["retry retry"]
+        assert [e.message for e in dotall] == ["first\nsecond"]
+
+    def test_empty_criteria_are_no_ops(self, sample_log_path: str) -> None:
+        """Test empty criteria, short sorts and wide limits return the input."""
+        logs = LogEntries(LogParser(sample_log_path).parse())
+        f = LogFilter(logs)
+
+        assert f.by_level() is logs
+        assert f.by_message(None) is logs
+        with_message = [e for e in logs if e.message is not None]
+        assert list(f.by_message("")) == with_message
+        assert list(f.by_message(".*", regex=True)) == with_message
+        assert f.by_messages() is logs
+        assert f.by_action_type() is logs
+        assert f.by_task_uuid() is logs
+        assert f.by_time_range(None, None) is logs
+        assert f.limit(len(logs)) is logs
+        one = logs.limit(1)
+        assert one.sort() is one
+
+        start = logs[1].timestamp
+        assert list(f.by_time_range(start, None)) == [e for e in logs if e.timestamp >= start]
+
+    def test_match_all_message_patterns_drop_missing_messages(self) -> None:
+        """Test "" and regex ".*" keep only entries that have a message."""
+        logs = [
+            LogEntry.from_dict({"tid": "a", "ts": 1.0, "msg": "hello"}),
+            LogEntry.from_dict({"tid": "a", "ts": 2.0}),
+        ]
+
+        assert [e.timestamp for e in LogFilter(logs).by_message("")] == [1.0]
+        assert [e.timestamp for e in LogFilter(logs).by_message(".*", regex=True)] == [1.0]
+        assert len(LogFilter(logs).by_message(None)) == 2
+
     def test_by_action_type(self, sample_log_path: str) -> None:
         """Test filtering by action type."""
         parser = LogParser(sample_log_path)
@@ -71,6 +147,18 @@ class TestLogFilter:
             e.action_type in ("database.query", "api.call") for e in result
         )
 
+    def test_by_action_type_glob(self) -> None:
+        """Test glob patterns mixed with exact action types."""
+        logs = [
+            LogEntry.from_dict({"tid": "a", "ts": float(i), "at": at})
+            for i, at in enumerate(["database:query", "database:commit", "http:get", "cache:hit"])
+        ]
+        logs.append(LogEntry.from_dict({"tid": "a", "ts": 9.0, "mt": "loggerx:info"}))
+
+        result = LogFilter(logs).by_action_type("database:*", "cache:hit")
+
+        assert [e.action_type for e in result] == ["database:query", "database:commit", "cache:hit"]
+
     def test_by_field(self, sample_log_path: str) -> None:
         """Test filtering by field value."""
         parser = LogParser(sample_log_path)
@@ -188,6 +276,21 @@ class TestLogFilter:
         assert isinstance(grouped, dict)
         assert len(grouped) > 0
 
+    def test_group_by_interleaved_runs(self) -> None:
+        """Test grouping keeps first-seen order when runs of a key interleave."""
+        from logxy_log_parser import LogEntry
+
+        logs = [
+            LogEntry.from_dict({"tid": tid, "ts": float(i), "mt": "info"})
+            for i, tid in enumerate(["a", "a", "b", "a", "c", "b"])
+        ]
+
+        grouped = LogFilter(logs).group_by("task_uuid")
+
+        assert list(grouped) == ["a", "b", "c"]
+        assert [len(grouped[k]) for k in grouped] == [3, 2, 1]
+        assert [e.timestamp for e in grouped["a"]] == [0.0, 1.0, 3.0]
+
 
 class TestLogEntries:
     """Tests for LogEntries collection."""
@@ -244,3 +347,16 @@ class TestLogEntries:
         # Should have entries with unique task UUIDs
         uuids = {e.task_uuid for e in unique}
         assert len(uuids) <= len(unique)
+
+    def test_unique_keeps_first_in_order(self) -> None:
+        """Test unique keeps the first entry per key in original order."""
+        from logxy_log_parser import LogEntries
+
+        logs = [
+            LogEntry.from_dict({"task_uuid": tid, "timestamp": float(i)})
+            for i, tid in enumerate(["b", "a", "b", "c", "a"])
+        ]
+        unique = LogEntries(logs).unique("task_uuid")
+
+        assert [e.task_uuid for e in unique] == ["b", "a", "c"]
+        assert [e.timestamp for e in unique] == [0.0, 1.0, 3.0]
@@ -0,0 +1,67 @@
+"""Tests for indexing functionality."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from logxy_log_parser import LogIndex
+
+
+def _write_log(path: Path) -> None:
+    levels = ["info", "error", "warning", "error"]
+    with open(path, "w") as f:
+        for i in range(12):
+            f.write(json.dumps({
+                "task_uuid": f"task-{i % 3}",
+                "timestamp": 1738332000.0 + (11 - i),
+                "message_type": f"loggerx:{levels[i % 4]}",
+            }) + "\n")
+
+
+class TestLogIndex:
+    """Tests for LogIndex class."""
+
+    def test_lookups(self, tmp_path: Path) -> None:
+        """Test level, task and time range lookups return the indexed lines."""
+        log_file = tmp_path / "indexed.log"
+        _write_log(log_file)
+        index = LogIndex(log_file)
+        index.build()
+
+        assert [p.line_number for p in index.find_by_level("ERROR")] == [2, 4, 6, 8, 10, 12]
+        assert [p.line_number for p in index.find_by_task("task-1")] == [2, 5, 8, 11]
+        assert [p.line_number for p in index.find_by_time_range(1738332001.0, 1738332003.0)] == [11, 10, 9]
+        assert index.stats.level_counts == {"info": 3, "error": 6, "warning": 3}
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Test a saved index answers queries the same after loading."""
+        log_file = tmp_path / "indexed.log"
+        _write_log(log_file)
+        index = LogIndex(log_file)
+        index.build()
+        index.save()
+
+        loaded = LogIndex.load(tmp_path / "indexed.log.index")
+
+        assert loaded.query(level="error", start_time=1738332005.0) == index.query(
+            level="error", start_time=1738332005.0
+        )
+        assert [p.line_number for p in loaded.find_by_time_range(0, 1738332000.0)] == [12]
+
+    def test_gzipped_file(self, tmp_path: Path) -> None:
+        """Test a gzipped log indexes like the plain file and loads its lines."""
+        import gzip
+
+        plain = tmp_path / "indexed.log"
+        _write_log(plain)
+        gz_file = tmp_path / "indexed.log.gz"
+        gz_file.write_bytes(gzip.compress(plain.read_bytes()))
+        expected = LogIndex(plain)
+        expected.build()
+        index = LogIndex(gz_file)
+        index.build()
+
+        positions = index.find_by_task("task-2")
+        assert positions == expected.find_by_task("task-2")
+        assert [e.line_number for e in index.get_lines(positions)] == [3, 6, 9, 12]
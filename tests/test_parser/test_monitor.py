@@ -138,6 +138,23 @@ class TestLogFile:
         entries = logfile.tail(3)
         assert len(entries) <= 3
 
+    def test_tail_line_numbers(self, tmp_path: str) -> None:
+        """Test tail skips blank and invalid lines and keeps file line numbers."""
+        import os
+
+        log_file = os.path.join(tmp_path, "tail.log")
+        with open(log_file, "w") as f:
+            for i in range(6):
+                f.write(json.dumps({"tid": "a", "ts": float(i)}) + "\n")
+                f.write("\n" if i % 2 else "not json\n")
+
+        logfile = LogFile(log_file)
+
+        assert logfile.line_count == 12
+        assert logfile.entry_count == 6
+        assert [(e.line_number, e.timestamp) for e in logfile.tail(3)] == [(7, 3.0), (9, 4.0), (11, 5.0)]
+        assert len(logfile.tail(100)) == 6
+
     def test_refresh(self, sample_log_path: str) -> None:
         """Test refreshing file state."""
         logfile = LogFile(sample_log_path)
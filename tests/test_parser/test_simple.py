@@ -0,0 +1,126 @@
+"""Tests for the simple one-line API."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from logxy_log_parser import Level, check_log, parse_log
+
+
+class TestParseLog:
+    """Tests for parse_log and check_log."""
+
+    def test_min_level_skips_lower_records(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test LOGXY_MIN_LEVEL drops records below the threshold while reading."""
+        from logxy_log_parser.src import simple
+
+        log_file = tmp_path / "levels.log"
+        with open(log_file, "w") as f:
+            for i, name in enumerate(["debug", "info", "debug", "warning", "error"]):
+                f.write(json.dumps({"tid": "a", "ts": float(i), "mt": f"loggerx:{name}"}) + "\n")
+            f.write(json.dumps({"tid": "a", "ts": 9.0, "at": "db:query", "st": "failed"}) + "\n")
+
+        assert len(parse_log(log_file)) == 6
+
+        monkeypatch.setattr(simple, "_MIN_LEVEL", Level.WARNING)
+        result = check_log(log_file)
+
+        assert [e.level for e in result.entries] == [Level.WARNING, Level.ERROR, Level.ERROR]
+        assert result.total_lines == 6
+        assert result.error_count == 2
+
+    def test_repeated_parses_do_not_share_entries(self, sample_log_path: Path) -> None:
+        """Test mutating one parse's entries leaves later parses untouched."""
+        first = parse_log(sample_log_path)
+        first[0].fields["tampered"] = True
+
+        second = parse_log(sample_log_path)
+
+        assert second[0] is not first[0]
+        assert "tampered" not in second[0].fields
+
+    def test_disk_cache_reused_across_processes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test LOGXY_CACHE pickles parses and later cold parses load them."""
+        from logxy_log_parser.src import simple
+
+        log_file = tmp_path / "cached.log"
+        with open(log_file, "w") as f:
+            for i in range(3):
+                f.write(json.dumps({"tid": "a", "ts": float(i), "mt": "loggerx:info"}) + "\n")
+
+        monkeypatch.setattr(simple, "_CACHE_DIR", tmp_path / "cache")
+        first = parse_log(log_file)
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+        # A later parse must load the pickle rather than re-read the log
+        def fail(*args: object) -> None:
+            raise AssertionError("log file was parsed again")
+
+        monkeypatch.setattr(simple, "_read_entries", fail)
+        second = parse_log(log_file)
+
+        assert [(e.task_uuid, e.timestamp) for e in second] == [(e.task_uuid, e.timestamp) for e in first]
+
+    def test_disk_cache_keeps_latest_snapshot(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test appends replace the cached snapshot and unloadable cache files are dropped."""
+        import os
+
+        from logxy_log_parser.src import simple
+
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(simple, "_CACHE_DIR", cache_dir)
+        log_file = tmp_path / "growing.log"
+        log_file.write_text("")
+
+        for i in range(5):
+            with open(log_file, "a") as f:
+                f.write(json.dumps({"tid": "a", "ts": float(i), "mt": "loggerx:info"}) + "\n")
+            st = os.stat(log_file)
+            os.utime(log_file, ns=(st.st_atime_ns, st.st_mtime_ns + (i + 1) * 1_000_000))
+            assert len(parse_log(log_file)) == i + 1
+
+        (cache_file,) = cache_dir.glob("*.pkl")
+
+        # A pickle referencing a module this version lacks must not break parsing
+        cache_file.write_bytes(b"cgone_module\nEntry\n.")
+
+        assert len(parse_log(log_file)) == 5
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+
+class TestTypes:
+    """Tests for types()."""
+
+    def test_types_unique_values(self) -> None:
+        """Test types collects distinct attribute and field values as strings."""
+        from logxy_log_parser import LogEntry, types
+
+        entries = [
+            LogEntry.from_dict({"tid": "a", "ts": float(i), "mt": mt, "shard": shard})
+            for i, (mt, shard) in enumerate([("loggerx:info", 1), ("loggerx:error", 1), ("loggerx:info", None)])
+        ]
+
+        assert types(entries, "message_type") == {"loggerx:info", "loggerx:error"}
+        assert types(entries, "shard") == {"1"}
+        assert types(entries) == set()
+
+
+class TestCountBy:
+    """Tests for count_by()."""
+
+    def test_count_by_key_applies_filters(self) -> None:
+        """Test tallying by a key only counts entries matching the filters."""
+        from logxy_log_parser import LogEntry, count_by
+
+        entries = [
+            LogEntry.from_dict({"tid": "a", "ts": float(i), "mt": f"loggerx:{lvl}", "at": at})
+            for i, (lvl, at) in enumerate([("error", "db"), ("info", "db"), ("error", "http"), ("error", "db")])
+        ]
+
+        assert count_by(entries, level="error") == 3
+        assert count_by(entries, "action_type") == {"db": 3, "http": 1}
+        assert count_by(entries, "action_type", level="error") == {"db": 2, "http": 1}
+        assert count_by(entries, "action_type", level="error", action_type="db") == {"db": 2}